@@ -0,0 +1,102 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Import-time benchmark for the lightweight entry points of xsuite.
+
+Each scenario runs in a fresh interpreter, so that nothing is cached in
+`sys.modules`. Besides the timings, the benchmark records which of the heavy
+packages got imported: `import xsuite`, `xsuite.__version__`, the
+`xsuite-prebuild` command line and its `clean` command must not import any of
+them, and the script
+exits with a non-zero status if they do.
+
+Usage: python benchmarks/bench_import.py [--repeat N] [--output FILE]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ('xobjects', 'xtrack', 'xfields', 'xcoll', 'xsuite.kernel_definitions')
+
+SCENARIOS = {
+    'import_xsuite': 'import xsuite',
+    'xsuite_version': 'import xsuite; xsuite.__version__',
+    'prebuild_cli': 'import xsuite.cli',
+    'prebuilt_kernels_location': 'import xsuite; xsuite.PREBUILT_KERNELS_LOCATION',
+    # What `xsuite-prebuild clean` runs, on a scratch directory
+    'clean': 'import tempfile; from xsuite.prebuild_kernels import clear_kernels; '
+             'clear_kernels(location=tempfile.mkdtemp())',
+    # Reference point: what a kernel lookup has to import
+    'get_suitable_kernel': 'from xsuite import get_suitable_kernel; '
+                           'import xsuite.kernel_definitions',
+}
+
+# Scenarios that are expected to stay free of the heavy imports
+LIGHT_SCENARIOS = (
+    'import_xsuite', 'xsuite_version', 'prebuild_cli', 'prebuilt_kernels_location',
+    'clean',
+)
+
+_PROBE = '''
+import json, sys, time
+t0 = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - t0
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy_modules": heavy}}))
+'''
+
+
+def run_scenario(statement, repeat):
+    """Time `statement` in `repeat` fresh interpreters."""
+    timings = []
+    heavy_modules = set()
+    for _ in range(repeat):
+        code = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+        out = subprocess.run(
+            [sys.executable, '-c', code],
+            check=True, capture_output=True, text=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        timings.append(result['seconds'])
+        heavy_modules.update(result['heavy_modules'])
+
+    return {
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'heavy_modules': sorted(heavy_modules),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    results = {
+        name: run_scenario(statement, args.repeat)
+        for name, statement in SCENARIOS.items()
+    }
+
+    for name, result in results.items():
+        print(f'{name:<28} min {result["min_s"] * 1e3:9.1f} ms   '
+              f'median {result["median_s"] * 1e3:9.1f} ms   '
+              f'heavy imports: {", ".join(result["heavy_modules"]) or "none"}')
+
+    if args.output:
+        with open(args.output, 'w') as fd:
+            json.dump(results, fd, indent=4)
+
+    regressions = [name for name in LIGHT_SCENARIOS if results[name]['heavy_modules']]
+    if regressions:
+        print(f'Heavy packages imported by: {", ".join(regressions)}', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,310 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Performance benchmark suite of xsuite, to compare releases of the pinned
+Xtrack, Xfields and Xcoll versions.
+
+The suite measures:
+
+* `import`: the import time of the entry points (see `bench_import.py`);
+* `lookup`: the latency of `get_suitable_kernel`, on the installed kernels and
+  on a synthetic directory of hundreds of kernel metadata files, with and
+  without the consolidated index, both for a first and a memoized lookup;
+* `load`: the time to load each installed kernel module;
+* `build`: the compile time of each installed kernel, as recorded when it was
+  built, and, with `--build`, the time to build a small custom kernel now;
+* `tracking`: the throughput, first-call latency and peak memory of each
+  installed kernel on the benchmark lines (see `xsuite.bench`).
+
+Every measurement runs in a fresh interpreter. The results are saved as a flat
+set of named metrics, each with its unit and whether lower or higher is
+better, so that two result files can be compared with `--baseline`; the
+script then exits with a non-zero status if a metric got worse by more than
+`--tolerance`.
+
+Usage: python benchmarks/bench_suite.py [--only SECTIONS] [--build]
+       [--output FILE] [--baseline FILE] [--tolerance FRACTION]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_import import SCENARIOS, run_scenario
+
+SECTIONS = ('import', 'lookup', 'load', 'build', 'tracking')
+# Bump when the metrics change meaning, results of other versions are not compared
+SUITE_VERSION = 1
+SYNTHETIC_KERNEL_COUNT = 500
+LOOKUP_CLASSES = ('Drift', 'Multipole')
+
+_LOOKUP_PROBE = '''
+import json, time
+import xobjects as xo
+import xtrack as xt
+from xsuite.kernel_definitions import BASE_CONFIG, NAME_CLASS_MAP
+from xsuite.prebuild_kernels import PrebuiltKernelNotFoundError, get_suitable_kernel
+
+classes = [NAME_CLASS_MAP[name]._XoStruct for name in {classes!r}]
+timings = []
+for _ in range(2):
+    start_time = time.perf_counter()
+    try:
+        result = get_suitable_kernel(dict(BASE_CONFIG), classes, [xt.Particles],
+                                     context=xo.ContextCpu(), search_path={search_path!r})
+    except PrebuiltKernelNotFoundError:
+        result = None
+    timings.append(time.perf_counter() - start_time)
+print(json.dumps({{"first_s": timings[0], "memoized_s": timings[1],
+                  "hit": result["module_name"] if result else None}}))
+'''
+
+_LOAD_PROBE = '''
+import importlib.util, json, time
+start_time = time.perf_counter()
+spec = importlib.util.spec_from_file_location({module_name!r}, {binary_file!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(json.dumps({{"seconds": time.perf_counter() - start_time}}))
+'''
+
+
+def bench_import(repeat):
+    metrics = {}
+    for name, statement in SCENARIOS.items():
+        result = run_scenario(statement, repeat)
+        metrics[f'import.{name}'] = _metric(result['median_s'], 's')
+    return metrics
+
+
+def bench_lookup(repeat, n_synthetic=SYNTHETIC_KERNEL_COUNT):
+    from xsuite.prebuild_kernels import save_kernel_index
+
+    metrics = _lookup_metrics('lookup.installed', repeat, search_path=False)
+
+    with tempfile.TemporaryDirectory(prefix='xsuite_bench_') as location:
+        _write_synthetic_kernels(Path(location), n_synthetic)
+        env = {'XSUITE_KERNEL_PATH': location, 'XSUITE_KERNEL_CACHE': ''}
+        save_kernel_index(location)
+        metrics.update(_lookup_metrics(
+            f'lookup.synthetic_{n_synthetic}', repeat, search_path=True, env=env))
+        (Path(location) / '_index.json').unlink()
+        metrics.update(_lookup_metrics(
+            f'lookup.synthetic_{n_synthetic}_no_index', repeat, search_path=True, env=env))
+    return metrics
+
+
+def bench_load(repeat):
+    from xsuite.prebuild_kernels import PREBUILT_KERNELS_LOCATION, enumerate_kernels, \
+        _kernel_binary_file
+
+    metrics = {}
+    for module_name, _ in enumerate_kernels():
+        binary_file = _kernel_binary_file(module_name, PREBUILT_KERNELS_LOCATION)
+        code = _LOAD_PROBE.format(module_name=module_name, binary_file=str(binary_file))
+        timings = [_run_probe(code)['seconds'] for _ in range(repeat)]
+        metrics[f'load.{module_name}'] = _metric(statistics.median(timings), 's')
+        metrics[f'size.{module_name}'] = _metric(binary_file.stat().st_size, 'bytes')
+    return metrics
+
+
+def bench_build(build_now):
+    from xsuite.prebuild_kernels import enumerate_kernels
+
+    metrics = {}
+    for module_name, metadata in enumerate_kernels():
+        build_stats = metadata.get('build')
+        if build_stats is None:
+            continue
+        metrics[f'build.{module_name}.recorded_duration'] = _metric(
+            build_stats['duration_s'], 's')
+        if build_stats.get('peak_rss_bytes') is not None:
+            metrics[f'build.{module_name}.recorded_peak_rss'] = _metric(
+                build_stats['peak_rss_bytes'], 'bytes')
+
+    if build_now:
+        with tempfile.TemporaryDirectory(prefix='xsuite_bench_') as location:
+            code = (
+                'from xsuite.prebuild_kernels import build_kernel_from_line\n'
+                'from xsuite.workloads import thin_ring_line\n'
+                f'build_kernel_from_line(thin_ring_line(n_cells=1), location={location!r}, '
+                'incremental=False)\n'
+            )
+            start_time = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], check=True,
+                           stdout=subprocess.DEVNULL, env=_environment())
+            metrics['build.custom_thin_ring'] = _metric(
+                time.perf_counter() - start_time, 's')
+    return metrics
+
+
+def bench_tracking(particle_counts, n_turns):
+    from xsuite.bench import run_benchmarks
+
+    metrics = {}
+    for entry in run_benchmarks(particle_counts=particle_counts, n_turns=n_turns)['results']:
+        kernel_line = f'tracking.{entry["kernel"]}.{entry["line"]}'
+        metrics[f'{kernel_line}.{entry["n_particles"]}.throughput'] = _metric(
+            entry['particle_turns_per_s'], 'particle-turns/s', better='higher')
+        metrics[f'{kernel_line}.first_call'] = _metric(entry['first_call_s'], 's')
+        if entry['peak_rss_bytes'] is not None:
+            metrics[f'{kernel_line}.peak_rss'] = _metric(entry['peak_rss_bytes'], 'bytes')
+    return metrics
+
+
+def compare(results, baseline, tolerance):
+    """
+    Return the (name, ratio) of the metrics of `results` that are worse than
+    in `baseline` by more than `tolerance`, the ratio being new / old.
+    """
+    if baseline.get('suite_version') != results['suite_version']:
+        raise ValueError('The baseline was made with another version of the suite.')
+
+    regressions = []
+    for name, metric in results['metrics'].items():
+        reference = baseline['metrics'].get(name)
+        if reference is None or not reference['value']:
+            continue
+        ratio = metric['value'] / reference['value']
+        if metric['better'] == 'lower' and ratio > 1 + tolerance:
+            regressions.append((name, ratio))
+        elif metric['better'] == 'higher' and ratio < 1 - tolerance:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def _metric(value, unit, better='lower'):
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+def _lookup_metrics(prefix, repeat, search_path, env=None):
+    code = _LOOKUP_PROBE.format(classes=LOOKUP_CLASSES, search_path=search_path)
+    runs = [_run_probe(code, env) for _ in range(repeat)]
+    return {
+        f'{prefix}.first': _metric(statistics.median(run['first_s'] for run in runs), 's'),
+        f'{prefix}.memoized': _metric(
+            statistics.median(run['memoized_s'] for run in runs), 's'),
+    }
+
+
+def _write_synthetic_kernels(location, count):
+    """
+    Write the metadata of `count` custom kernels, with empty binaries, of
+    which only the last one matches the lookup of `_LOOKUP_PROBE`, so that
+    every lookup goes through all of them.
+    """
+    from xsuite.kernel_definitions import BASE_CONFIG, NAME_CLASS_MAP
+    from xsuite.prebuild_kernels import (
+        SERIAL_CONTEXT, _current_package_versions, _kernel_binary_file,
+        _kernel_module_name,
+    )
+
+    class_names = sorted(NAME_CLASS_MAP)
+    versions = _current_package_versions()
+    for idx in range(count):
+        base_module_name = f'custom_{idx:012x}'
+        module_name = _kernel_module_name(base_module_name, SERIAL_CONTEXT)
+        config = dict(BASE_CONFIG)
+        if idx < count - 1:
+            config[f'XSUITE_BENCH_CONFIG_{idx}'] = True
+        tracker_class_names = sorted(
+            {*LOOKUP_CLASSES, *class_names[idx % len(class_names)::7]})
+        metadata = {
+            'base_module_name': base_module_name,
+            'context': SERIAL_CONTEXT,
+            'config': config,
+            'tracker_element_classes': tracker_class_names,
+            'classes': [*tracker_class_names, 'Particles'],
+            'versions': versions,
+            'custom': True,
+        }
+        with (location / f'{module_name}.json').open('w') as fd:
+            json.dump(metadata, fd)
+        _kernel_binary_file(module_name, location).touch()
+
+
+def _run_probe(code, env=None):
+    process = subprocess.run(
+        [sys.executable, '-c', code],
+        check=True, capture_output=True, text=True, env=_environment(env),
+    )
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def _environment(extra=None):
+    env = {key: value for key, value in os.environ.items()
+           if key not in ('XSUITE_KERNEL_PATH', 'XSUITE_PRELOAD_KERNELS')}
+    env.update(extra or {})
+    return env
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--only', type=lambda value: value.split(','),
+                        default=SECTIONS,
+                        help=f'comma-separated sections among {", ".join(SECTIONS)}')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--build', action='store_true',
+                        help='also time the build of a small custom kernel')
+    parser.add_argument('--particles', type=lambda value: [int(n) for n in value.split(',')],
+                        default=[1000, 10000])
+    parser.add_argument('--turns', type=int, default=10)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare with the results in this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.1)
+    args = parser.parse_args()
+
+    unknown_sections = set(args.only) - set(SECTIONS)
+    if unknown_sections:
+        parser.error(f'unknown section(s) {", ".join(sorted(unknown_sections))}')
+
+    from xsuite.bench import _host_info
+    from xsuite.prebuild_kernels import _current_package_versions
+
+    metrics = {}
+    if 'import' in args.only:
+        metrics.update(bench_import(args.repeat))
+    if 'lookup' in args.only:
+        metrics.update(bench_lookup(args.repeat))
+    if 'load' in args.only:
+        metrics.update(bench_load(args.repeat))
+    if 'build' in args.only:
+        metrics.update(bench_build(args.build))
+    if 'tracking' in args.only:
+        metrics.update(bench_tracking(args.particles, args.turns))
+
+    results = {
+        'suite_version': SUITE_VERSION,
+        'host': _host_info(),
+        'versions': _current_package_versions(),
+        'metrics': metrics,
+    }
+
+    name_width = max([len('Metric')] + [len(name) for name in metrics])
+    for name, metric in metrics.items():
+        print(f'{name:<{name_width}}  {metric["value"]:>12.4g} {metric["unit"]}')
+
+    if args.output:
+        with open(args.output, 'w') as fd:
+            json.dump(results, fd, indent=4)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as fd:
+            baseline = json.load(fd)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, ratio in regressions:
+            print(f'Regression: `{name}` is {ratio:.2f} times the baseline.',
+                  file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
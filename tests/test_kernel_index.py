@@ -0,0 +1,55 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+import json
+import os
+
+import pytest
+
+from xsuite import prebuild_kernels
+
+
+def _write_metadata(location, module_name, config):
+    tmp_file = location / f'.{module_name}.json.tmp'
+    tmp_file.write_text(json.dumps({
+        'base_module_name': module_name.removesuffix('_cpu_serial'),
+        'context': 'cpu_serial',
+        'config': config,
+    }))
+    os.replace(tmp_file, location / f'{module_name}.json')
+
+
+def _index_entries(location):
+    file_names = prebuild_kernels._list_kernel_directory(location)
+    metadata_file_names = sorted(
+        name for name in file_names if name.endswith('.json') and not name.startswith('_'))
+    return prebuild_kernels._read_kernel_index(location, metadata_file_names)
+
+
+@pytest.fixture
+def location(tmp_path):
+    _write_metadata(tmp_path, 'first_cpu_serial', {})
+    _write_metadata(tmp_path, 'second_cpu_serial', {})
+    prebuild_kernels.save_kernel_index(tmp_path, ['first', 'second'], {})
+    return tmp_path
+
+
+def test_index_is_used_when_up_to_date(location):
+    entries = _index_entries(location)
+    assert [name for name, _ in entries] == ['first_cpu_serial.json',
+                                             'second_cpu_serial.json']
+
+
+def test_index_is_stale_after_metadata_change(location):
+    _write_metadata(location, 'first_cpu_serial', {'XTRACK_GLOBAL_XY_LIMIT': 2.0})
+    assert _index_entries(location) is None
+
+    prebuild_kernels.save_kernel_index(location)
+    entries = dict(_index_entries(location))
+    assert entries['first_cpu_serial.json'][1]['config'] == {'XTRACK_GLOBAL_XY_LIMIT': 2.0}
+
+
+def test_index_is_stale_after_removing_a_kernel(location):
+    (location / 'second_cpu_serial.json').unlink()
+    assert _index_entries(location) is None
@@ -0,0 +1,61 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+import numpy as np
+import pytest
+import xtrack as xt
+
+import xsuite
+from xsuite import instrumentation, prebuild_kernels
+
+
+def _drift_line():
+    return xt.Line(elements=[xt.Drift(length=1.0), xt.Drift(length=2.0)])
+
+
+@pytest.fixture(scope='module')
+def user_cache(tmp_path_factory):
+    location = tmp_path_factory.mktemp('user_cache')
+    module_names = prebuild_kernels.build_kernel_from_line(
+        _drift_line(), location=location)
+    return location, module_names[0]
+
+
+@pytest.fixture
+def prebuilt_location(user_cache, tmp_path, monkeypatch):
+    location, _ = user_cache
+    prebuilt_location = tmp_path / 'lib'
+    prebuilt_location.mkdir()
+    monkeypatch.setattr(prebuild_kernels, 'PREBUILT_KERNELS_LOCATION', prebuilt_location)
+    monkeypatch.setattr(xsuite, 'PREBUILT_KERNELS_LOCATION', prebuilt_location,
+                        raising=False)
+    monkeypatch.setenv('XSUITE_KERNEL_PATH', '')
+    monkeypatch.setenv('XSUITE_KERNEL_CACHE', str(location))
+    prebuild_kernels.invalidate_kernel_cache()
+    instrumentation.reset_kernel_stats()
+    yield prebuilt_location
+    prebuild_kernels.invalidate_kernel_cache()
+
+
+def test_xtrack_uses_the_user_cache(user_cache, prebuilt_location):
+    _, module_name = user_cache
+
+    line = _drift_line()
+    line.build_tracker()
+    particles = xt.Particles(x=[1e-3, 2e-3], px=[1e-4, 0])
+    line.track(particles)
+
+    assert instrumentation.kernel_stats()['hits_by_kernel'] == {module_name: 1}
+    assert prebuild_kernels._kernel_binary_file(module_name, prebuilt_location).is_symlink()
+    assert np.allclose(particles.x, [1.3e-3, 2e-3])
+
+
+def test_user_cache_not_searched_when_disabled(user_cache, prebuilt_location):
+    line = _drift_line()
+    line.build_tracker(compile=False)
+    kernel = xsuite.get_suitable_kernel(
+        line.config, line.tracker.line_element_classes, [], search_path=False)
+
+    assert kernel is None
+    assert list(prebuilt_location.iterdir()) == []
@@ -0,0 +1,51 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+import os
+
+import pytest
+
+from xsuite import object_cache
+
+KEY = 'ab' + 62 * '0'
+
+
+@pytest.fixture
+def binary(tmp_path):
+    binary = tmp_path / 'kernel.so'
+    binary.write_bytes(b'\x7fELF')
+    return binary
+
+
+def test_store_and_fetch(tmp_path, binary, monkeypatch):
+    monkeypatch.setenv(object_cache.OBJECT_CACHE_ENV, str(tmp_path / 'cache'))
+    object_cache.store(KEY, binary)
+
+    target = tmp_path / 'fetched.so'
+    assert object_cache.fetch(KEY, target)
+    assert target.read_bytes() == binary.read_bytes()
+
+
+@pytest.mark.skipif(os.geteuid() == 0, reason='root can write to read-only directories')
+def test_store_into_read_only_cache(tmp_path, binary, monkeypatch):
+    location = tmp_path / 'cache'
+    location.mkdir()
+    location.chmod(0o555)
+    monkeypatch.setenv(object_cache.OBJECT_CACHE_ENV, str(location))
+    try:
+        object_cache.store(KEY, binary)
+        assert not object_cache.fetch(KEY, tmp_path / 'fetched.so')
+        assert list(location.iterdir()) == []
+    finally:
+        location.chmod(0o755)
+
+
+def test_store_into_unusable_cache(tmp_path, binary, monkeypatch):
+    # A file in place of the cache directory, which cannot be created either
+    location = tmp_path / 'cache'
+    location.write_text('')
+    monkeypatch.setenv(object_cache.OBJECT_CACHE_ENV, str(location))
+
+    object_cache.store(KEY, binary)
+    assert not object_cache.fetch(KEY, tmp_path / 'fetched.so')
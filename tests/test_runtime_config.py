@@ -0,0 +1,91 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+import numpy as np
+import pytest
+import xobjects as xo
+import xtrack as xt
+
+import xsuite
+from xsuite import prebuild_kernels, runtime_config, workloads
+
+BASE_CONFIG = {'XTRACK_GLOBAL_XY_LIMIT': 1.0}
+
+
+@pytest.fixture(scope='module')
+def kernel_location(tmp_path_factory):
+    location = tmp_path_factory.mktemp('kernels')
+    for base_module_name, runtime in (('custom_exact', False),
+                                      ('custom_runtime', True)):
+        definition = {
+            'config': BASE_CONFIG,
+            'classes': [xt.Drift, xt.DriftSlice],
+            'extra_classes': [xt.Particles],
+        }
+        if runtime:
+            definition['runtime_config'] = True
+        module_name = prebuild_kernels._kernel_module_name(
+            base_module_name, prebuild_kernels.SERIAL_CONTEXT)
+        prebuild_kernels.build_single_kernel(
+            0, 1, location, definition, module_name, base_module_name,
+            prebuild_kernels.SERIAL_CONTEXT, custom=True,
+        )
+    prebuild_kernels.save_kernel_index(location)
+    return location
+
+
+@pytest.fixture
+def search_path(kernel_location, monkeypatch):
+    monkeypatch.setenv('XSUITE_KERNEL_PATH', str(kernel_location))
+    monkeypatch.setenv('XSUITE_KERNEL_CACHE', '')
+    monkeypatch.setattr(runtime_config, '_BOUND_VALUES', {})
+    prebuild_kernels.invalidate_kernel_cache()
+    yield kernel_location
+    prebuild_kernels.invalidate_kernel_cache()
+
+
+def _lookup(xy_limit):
+    return xsuite.get_suitable_kernel(
+        {'XTRACK_GLOBAL_XY_LIMIT': xy_limit}, [xt.Drift._XoStruct, xt.DriftSlice._XoStruct], [],
+        context=xo.ContextCpu(), search_path=True,
+    )['module_name']
+
+
+def _track_drift(module_name, location, xy_limit):
+    line = xt.Line(elements=[xt.Drift(length=1.0)])
+    line.build_tracker(compile=False)
+    line.config.XTRACK_GLOBAL_XY_LIMIT = xy_limit
+    workloads.attach_kernel(
+        line, module_name, location, dict(line.config), ['Drift', 'DriftSlice'])
+    particles = xt.Particles(x=[0.5, 1.5, 2.5])
+    line.track(particles)
+    return particles.state
+
+
+def test_exact_match_is_preferred(search_path):
+    module_name = _lookup(1.0)
+    assert module_name == 'custom_exact_cpu_serial'
+    assert runtime_config._BOUND_VALUES == {}
+
+
+def test_default_lookup_after_non_default_lookup(search_path):
+    module_name = _lookup(2.0)
+    assert module_name == 'custom_runtime_cpu_serial'
+
+    module_name = _lookup(1.0)
+    assert module_name == 'custom_exact_cpu_serial'
+
+    # The runtime config kernel keeps the first value it was bound to
+    binary_file = prebuild_kernels._kernel_binary_file(
+        'custom_runtime_cpu_serial', search_path)
+    assert runtime_config.can_bind(binary_file, {'XTRACK_GLOBAL_XY_LIMIT': 2.0})
+    assert not runtime_config.can_bind(binary_file, {'XTRACK_GLOBAL_XY_LIMIT': 1.0})
+
+
+def test_kernels_track_with_their_values(search_path):
+    module_name = _lookup(2.0)
+    assert np.all(_track_drift(module_name, search_path, 2.0) == [1, 1, -1])
+
+    module_name = _lookup(1.0)
+    assert np.all(_track_drift(module_name, search_path, 1.0) == [1, -1, -1])
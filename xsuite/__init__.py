@@ -3,7 +3,27 @@
 # Copyright (c) CERN, 2024.                   #
 # ########################################### #
 
-from importlib.metadata import version
+import os
+from importlib import import_module
+
+# Public names provided by submodules, imported on first access. Looking up or
+# building kernels requires Xtrack, Xfields and Xcoll, which take a long time to
+# import, so `import xsuite` alone (e.g. for `xsuite.__version__` or the
+# `xsuite-prebuild` command line) does not import them.
+_LAZY_ATTRIBUTES = {
+    'PrebuiltKernelNotFoundError': 'xsuite.prebuild_kernels',
+    'get_suitable_kernel': 'xsuite.prebuild_kernels',
+    'get_suitable_kernels': 'xsuite.prebuild_kernels',
+    'PREBUILT_KERNELS_LOCATION': 'xsuite.prebuild_kernels',
+    'kernel_search_path': 'xsuite.prebuild_kernels',
+    'NAME_CLASS_MAP': 'xsuite.kernel_definitions',
+    'kernel_stats': 'xsuite.instrumentation',
+    'reset_kernel_stats': 'xsuite.instrumentation',
+    'preload_kernels': 'xsuite.preload',
+    'auto_cpu_context': 'xsuite.auto_context',
+    'swap_background_kernels': 'xsuite.background_build',
+}
+_LAZY_SUBMODULES = ('prebuild_kernels', 'kernel_definitions')
 
 # Enable lazy loading of the version: during package build Xsuite might not be
 # installed, leading to a PackageNotFind error when `version` is called. This
@@ -11,14 +31,27 @@ from importlib.metadata import version
 # is not needed, there will be no errors.
 def __getattr__(name: str):
     if name == "__version__":
+        from importlib.metadata import version
         value = version("xsuite")
         globals()["__version__"] = value  # Cache after first lookup
         return value
 
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+
+    if name in _LAZY_SUBMODULES:
+        return import_module(f'{__name__}.{name}')
+
     raise AttributeError(f"Module {__name__!r} has no attribute {name!r}")
 
-from .prebuild_kernels import (
-    PrebuiltKernelNotFoundError,
-    get_suitable_kernel,
-    PREBUILT_KERNELS_LOCATION,
-)
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES) | {'__version__'})
+
+
+# Opt-in: start loading the likely prebuilt kernels in the background, while the
+# user's code imports Xtrack and builds its line (see `xsuite.preload`).
+if os.environ.get('XSUITE_PRELOAD_KERNELS'):
+    import_module('xsuite.preload')._preload_from_environment()
@@ -0,0 +1,265 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Automatic choice between the serial and the OpenMP CPU contexts, and of the
+number of OpenMP threads, from the size of the tracking workload.
+
+With few particles, the OpenMP kernels are slower than the serial ones, as
+starting the threads costs more than they save. The choice is based on a
+calibration of this host: a micro-benchmark tracks a short synthetic line
+(see `xsuite.workloads`) with the prebuilt serial kernel and with the OpenMP
+kernel at several thread counts, and fits the time per turn of each with a
+fixed overhead plus a cost per element and particle. The calibration runs
+once, on first use or with `xsuite-prebuild calibrate`, and is saved next to
+the kernel metadata in the user kernel cache (see `kernel_search_path`).
+
+Xtrack splits the particles into one static chunk per thread, so the OpenMP
+schedule is not a run time choice.
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from xsuite.prebuild_kernels import (
+    OPENMP_CONTEXT, PREBUILT_KERNELS_LOCATION, SERIAL_CONTEXT, _available_cpus,
+    _print, user_kernel_cache_location,
+)
+
+CALIBRATION_FILE_NAME = '_openmp_calibration.json'
+# Bump when the calibration workload or the model changes
+CALIBRATION_VERSION = 1
+CALIBRATION_PARTICLE_COUNTS = (100, 1000, 10000, 100000)
+CALIBRATION_N_CELLS = 5
+CALIBRATION_N_TURNS = 3
+# OpenMP is only chosen when predicted to be faster than serial by this fraction
+OPENMP_MIN_GAIN = 0.05
+
+
+def auto_cpu_context(n_particles, line, calibration=None):
+    """
+    Return the CPU context to track `n_particles` through `line` (or through
+    a line of that many elements) in the shortest time: a serial context, or
+    an OpenMP context with the best number of threads. Pass the context to
+    `line.build_tracker(_context=...)`.
+    """
+    import xobjects as xo
+
+    n_elements = line if isinstance(line, int) else len(line.element_names)
+    choice = choose_cpu_context(n_particles, n_elements, calibration)
+    if choice['context'] == OPENMP_CONTEXT:
+        return xo.ContextCpu(omp_num_threads=choice['omp_num_threads'])
+    return xo.ContextCpu()
+
+
+def choose_cpu_context(n_particles, n_elements, calibration=None) -> dict:
+    """
+    Return the 'context' (serial or OpenMP), the 'omp_num_threads' and the
+    'predicted_s_per_turn' with the lowest predicted time per turn for
+    `n_particles` and `n_elements`. The calibration of this host is loaded,
+    or measured if there is none; serial is chosen when it cannot be measured.
+    """
+    if calibration is None:
+        calibration = load_calibration() or calibrate()
+
+    work = n_particles * n_elements
+    choice = {'context': SERIAL_CONTEXT, 'omp_num_threads': 0,
+              'predicted_s_per_turn': None}
+    if calibration.get(SERIAL_CONTEXT) is not None:
+        choice['predicted_s_per_turn'] = _predict(calibration[SERIAL_CONTEXT], work)
+
+    openmp_options = [
+        (_predict(model, work), int(n_threads))
+        for n_threads, model in (calibration.get(OPENMP_CONTEXT) or {}).items()
+    ]
+    if openmp_options:
+        predicted, n_threads = min(openmp_options)
+        serial_predicted = choice['predicted_s_per_turn']
+        if serial_predicted is None or predicted < (1 - OPENMP_MIN_GAIN) * serial_predicted:
+            choice = {'context': OPENMP_CONTEXT, 'omp_num_threads': n_threads,
+                      'predicted_s_per_turn': predicted}
+    return choice
+
+
+def load_calibration(location=None) -> Optional[dict]:
+    """
+    Return the saved calibration of this host, or None if there is none or
+    if it was made with other package versions or another calibration.
+    """
+    from xsuite.prebuild_kernels import _current_package_versions
+
+    calibration_file = _calibration_file(location)
+    try:
+        with calibration_file.open('r') as fd:
+            calibration = json.load(fd)['hosts'][_host_key()]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if (calibration.get('version') != CALIBRATION_VERSION
+            or calibration.get('versions') != _current_package_versions()):
+        return None
+    return calibration
+
+
+def calibrate(location=None, thread_counts=None) -> dict:
+    """
+    Measure the serial and OpenMP kernels on this host, save the result in
+    `location` (by default the user kernel cache, if enabled, or otherwise
+    the bundled kernel directory, if writable) and return it. OpenMP is
+    measured with `thread_counts` threads, by default the powers of two up
+    to the number of available CPUs, and that number itself.
+    """
+    from xsuite.prebuild_kernels import _current_package_versions
+
+    if thread_counts is None:
+        n_cpus = _available_cpus()
+        thread_counts = sorted({2 ** ii for ii in range(n_cpus.bit_length())} | {n_cpus})
+
+    kernels = _calibration_kernels()
+    calibration = {
+        'version': CALIBRATION_VERSION,
+        'versions': _current_package_versions(),
+        'kernels': {context_key: candidate.module_name
+                    for context_key, candidate in kernels.items()},
+        SERIAL_CONTEXT: None,
+        OPENMP_CONTEXT: {},
+    }
+    if SERIAL_CONTEXT in kernels:
+        _print('Calibrating the serial kernel...')
+        calibration[SERIAL_CONTEXT] = _fit(_measure(kernels[SERIAL_CONTEXT], 0))
+    if OPENMP_CONTEXT in kernels:
+        for n_threads in thread_counts:
+            _print(f'Calibrating the OpenMP kernel with {n_threads} thread(s)...')
+            calibration[OPENMP_CONTEXT][str(n_threads)] = _fit(
+                _measure(kernels[OPENMP_CONTEXT], n_threads))
+
+    _save_calibration(calibration, location)
+    return calibration
+
+
+def _predict(model, work):
+    return model['overhead_s'] + model['per_element_particle_s'] * work
+
+
+def _calibration_kernels():
+    """
+    Return the cheapest prebuilt kernel of each context that can track the
+    calibration line with the kernel's own config, by context. Kernels with
+    synchrotron radiation, which the usual workloads do not run, are left out.
+    """
+    from xsuite.prebuild_kernels import _find_kernel_candidates, kernel_search_path
+    from xsuite.workloads import thin_ring_line
+
+    line = thin_ring_line(n_cells=1)
+    line.build_tracker(compile=False)
+    line_class_names = {cls._DressingClass.__name__
+                        for cls in line.tracker.line_element_classes}
+
+    candidates, _ = _find_kernel_candidates(locations=kernel_search_path())
+    kernels = {}
+    for candidate in candidates:
+        if candidate.flavor is not None:
+            continue
+        if not line_class_names <= set(candidate.metadata['tracker_element_classes']):
+            continue
+        # The config keeps no False flags: an absent one compiles synrad in
+        if not candidate.metadata['config'].get('XTRACK_MULTIPOLE_NO_SYNRAD'):
+            continue
+        best = kernels.get(candidate.context)
+        if best is None or (candidate.class_mask.bit_count()
+                            < best.class_mask.bit_count()):
+            kernels[candidate.context] = candidate
+    return kernels
+
+
+def _measure(candidate, n_threads):
+    """
+    Return (elements x particles, seconds per turn) points for the kernel of
+    `candidate`, run serially, or with `n_threads` OpenMP threads.
+    """
+    import xobjects as xo
+
+    from xsuite.workloads import attach_kernel, ring_particles, thin_ring_line
+
+    if candidate.context == SERIAL_CONTEXT:
+        context = xo.ContextCpu()
+    else:
+        context = xo.ContextCpu(omp_num_threads=n_threads)
+
+    line = thin_ring_line(n_cells=CALIBRATION_N_CELLS)
+    line.build_tracker(_context=context, compile=False)
+    attach_kernel(line, candidate.module_name, candidate.location,
+                  candidate.metadata['config'],
+                  candidate.metadata['tracker_element_classes'])
+    n_elements = len(line.element_names)
+
+    points = []
+    for n_particles in CALIBRATION_PARTICLE_COUNTS:
+        particles = ring_particles(line, n_particles, _context=context)
+        line.track(particles, num_turns=1)  # Warm up
+        start_time = time.perf_counter()
+        line.track(particles, num_turns=CALIBRATION_N_TURNS)
+        duration = (time.perf_counter() - start_time) / CALIBRATION_N_TURNS
+        points.append((n_particles * n_elements, duration))
+    return points
+
+
+def _fit(points):
+    """
+    Fit the time per turn with an overhead plus a cost per element and
+    particle. The relative error is minimized, so that the overhead is set by
+    the small workloads rather than lost in the noise of the large ones.
+    """
+    # Normal equations of the least squares fit of 1 = a / t + b * w / t
+    s_aa = sum(1 / duration ** 2 for _, duration in points)
+    s_ab = sum(work / duration ** 2 for work, duration in points)
+    s_bb = sum(work ** 2 / duration ** 2 for work, duration in points)
+    s_a = sum(1 / duration for _, duration in points)
+    s_b = sum(work / duration for work, duration in points)
+    determinant = s_aa * s_bb - s_ab ** 2
+    overhead = (s_a * s_bb - s_b * s_ab) / determinant
+    slope = (s_aa * s_b - s_ab * s_a) / determinant
+    return {
+        'overhead_s': max(overhead, 0.),
+        'per_element_particle_s': max(slope, 0.),
+    }
+
+
+def _calibration_file(location=None):
+    if location is None:
+        location = user_kernel_cache_location() or PREBUILT_KERNELS_LOCATION
+    return Path(location) / CALIBRATION_FILE_NAME
+
+
+def _save_calibration(calibration, location=None):
+    """Add the calibration of this host to the calibration file, if writable."""
+    calibration_file = _calibration_file(location)
+    try:
+        with calibration_file.open('r') as fd:
+            saved = json.load(fd)
+    except (OSError, ValueError):
+        saved = {}
+    if not isinstance(saved.get('hosts'), dict):
+        saved = {'hosts': {}}
+    saved['hosts'][_host_key()] = calibration
+
+    try:
+        calibration_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = calibration_file.with_name(
+            f'{calibration_file.name}.{os.getpid()}.tmp')
+        with tmp_file.open('w') as fd:
+            json.dump(saved, fd, indent=4)
+        os.replace(tmp_file, calibration_file)
+    except OSError as err:
+        _print(f'Could not save the calibration to `{calibration_file}` ({err}).')
+
+
+def _host_key():
+    """Identify the host: a shared home directory may serve several node types."""
+    from xsuite.bench import _host_info
+
+    host = _host_info()
+    return f'{host["machine"]} {host["cpu_model"]} x{_available_cpus()}'
@@ -0,0 +1,305 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Compilation of missing kernels in a background process.
+
+When no prebuilt kernel matches a request and compilation is allowed, Xtrack
+compiles the kernel itself, which blocks the process for minutes. With
+`get_suitable_kernel(..., background=True)`, or the environment variable
+`XSUITE_BACKGROUND_COMPILE=1`, the exact kernel is instead compiled into the
+user kernel cache by a separate process, and the lookup immediately returns
+the cheapest prebuilt kernel that provides the requested classes with a more
+generic config: one lacking some of the `OPTIONAL_FEATURE_FLAGS` of the
+request (see `xsuite.runtime_config`). The tracker built with it can switch to
+the compiled kernel, between two calls to `track`, with
+`swap_background_kernels(line)`. The compilation runs on after the end of the
+process if needed, so that the next processes find the kernel in the cache.
+
+A kernel is compiled by one process at a time: the compiling process holds
+the lock file `.<module name>.lock` in the cache, and the other processes
+requesting the same kernel only wait for it to appear there. A lock left by a
+process that is gone, or older than `LOCK_TIMEOUT_S`, is taken over.
+
+The lookup falls back to the usual compilation when there is no such
+prebuilt kernel, or when the user kernel cache is disabled.
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from xsuite.prebuild_kernels import (
+    _cached_custom_kernel, _custom_kernel_name, _freeze_config, _kernel_module_name,
+    _print, user_kernel_cache_location,
+)
+
+BACKGROUND_COMPILE_ENV = 'XSUITE_BACKGROUND_COMPILE'
+# Age after which the lock of a compilation is considered abandoned, e.g. when
+# the lock was taken on another host of a shared file system
+LOCK_TIMEOUT_S = 3600
+
+_BUILDS = {}
+_BUILDS_LOCK = threading.Lock()
+
+
+class BackgroundBuild(NamedTuple):
+    """
+    A kernel being compiled into the user kernel cache by another process,
+    started by this process (`process`) or not (None), e.g. by another worker
+    of a job array, or already compiled.
+    """
+    module_name: str
+    context: str
+    config: frozenset
+    tracker_class_names: frozenset
+    location: Path
+    process: Optional[subprocess.Popen]
+    log_file: Path
+
+    def done(self):
+        """Tell whether the compilation is over, successful or not."""
+        if self.process is not None:
+            return self.process.poll() is not None
+        return not _lock_held(self.lock_file)
+
+    def ready(self):
+        """Tell whether the kernel was compiled and can be used."""
+        return self.done() and _cached_custom_kernel(self.location, self.module_name) is not None
+
+    def wait(self, poll_interval=1.0):
+        """Wait for the end of the compilation."""
+        if self.process is not None:
+            self.process.wait()
+            return
+        while not self.done():
+            time.sleep(poll_interval)
+
+    @property
+    def lock_file(self):
+        return self.location / f'.{self.module_name}.lock'
+
+
+def background_compile_requested(background=None):
+    """Return `background`, by default from `BACKGROUND_COMPILE_ENV`."""
+    if background is None:
+        value = os.environ.get(BACKGROUND_COMPILE_ENV, '').strip().lower()
+        background = value not in ('', '0', 'false', 'no')
+    return background
+
+
+def start_background_build(config, tracker_element_classes, classes, context_key):
+    """
+    Start compiling the kernel of a `get_suitable_kernel` request into the
+    user kernel cache, unless it is there already or being compiled by
+    another process, and return the `BackgroundBuild`. Return None if the
+    cache is disabled or not writable, or if the kernel cannot be described
+    to another process: classes outside of the kernel definitions or config
+    values that cannot be saved as JSON.
+    """
+    from xsuite.kernel_definitions import NAME_CLASS_MAP
+
+    location = user_kernel_cache_location()
+    if location is None:
+        return None
+
+    tracker_class_names = [cls._DressingClass.__name__ for cls in tracker_element_classes]
+    class_names = [getattr(cls, '_DressingClass', cls).__name__ for cls in classes]
+    if any(name not in NAME_CLASS_MAP for name in (*tracker_class_names, *class_names)):
+        return None
+    module_name = _kernel_module_name(
+        _custom_kernel_name([*tracker_class_names, *class_names], config),
+        context_key,
+    )
+    try:
+        spec = json.dumps({
+            'config': dict(config),
+            'tracker_element_classes': tracker_class_names,
+            'classes': class_names,
+            'context': context_key,
+            'lock_file': str(location / f'.{module_name}.lock'),
+        })
+    except TypeError:
+        return None
+
+    with _BUILDS_LOCK:
+        build = _BUILDS.get(module_name)
+        if build is not None:
+            return build
+
+        build = BackgroundBuild(
+            module_name=module_name,
+            context=context_key,
+            config=_freeze_config(config),
+            tracker_class_names=frozenset(tracker_class_names),
+            location=location,
+            process=None,
+            log_file=location / f'.{module_name}.log',
+        )
+        if _cached_custom_kernel(location, module_name) is None:
+            try:
+                location.mkdir(parents=True, exist_ok=True)
+                if _acquire_lock(build.lock_file):
+                    build = build._replace(process=_spawn_compilation(spec, build))
+                    _print(f'Compiling the kernel `{module_name}` in the background '
+                           f'(log: `{build.log_file}`).')
+                else:
+                    _print(f'The kernel `{module_name}` is being compiled by '
+                           f'another process (log: `{build.log_file}`).')
+            except OSError:
+                return None
+
+        _BUILDS[module_name] = build
+        return build
+
+
+def background_builds():
+    """Return the kernels requested in the background by this process so far."""
+    with _BUILDS_LOCK:
+        return list(_BUILDS.values())
+
+
+def swap_background_kernels(line, wait=False):
+    """
+    Make the tracker of `line` use the kernel of the user kernel cache for
+    its config and classes, if there is one: compiled in the background by
+    this process or by another one, or earlier. With `wait`, first wait for
+    the background compilations of this kernel. Call it between two calls to
+    `line.track`. Return True if the tracker switched to a kernel of the cache.
+    """
+    from xsuite.prebuild_kernels import (
+        OPENMP_CONTEXT, SERIAL_CONTEXT, _find_kernel_candidates, _select_kernel,
+    )
+    from xsuite.workloads import attach_kernel
+
+    tracker = line.tracker
+    config = _freeze_config(tracker.config)
+    context_key = (OPENMP_CONTEXT if tracker._context.openmp_enabled
+                   else SERIAL_CONTEXT)
+    class_names = {cls._DressingClass.__name__ for cls in tracker.line_element_classes}
+
+    if wait:
+        for build in background_builds():
+            if (build.context == context_key and build.config == config
+                    and class_names <= build.tracker_class_names):
+                build.wait()
+
+    location = user_kernel_cache_location()
+    if location is None:
+        return False
+    candidates, _ = _find_kernel_candidates(locations=(location,))
+    match, _, _ = _select_kernel(
+        candidates=candidates,
+        config=tracker.config,
+        frozen_config=config,
+        requested_tracker_class_names=sorted(class_names),
+        requested_class_names=[],
+        requested_context=context_key,
+    )
+    if match is None:
+        return False
+    module_name, tracker_element_classes, containing_dir, _ = match
+    attach_kernel(line, module_name, containing_dir, dict(tracker.config),
+                  [cls.__name__ for cls in tracker_element_classes])
+    return True
+
+
+def _spawn_compilation(spec, build):
+    """Start the process compiling `build`, which takes over its lock file."""
+    try:
+        with build.log_file.open('w') as log:
+            return subprocess.Popen(
+                [sys.executable, '-m', 'xsuite.background_build', spec],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,  # Not interrupted with the caller
+            )
+    except OSError:
+        build.lock_file.unlink(missing_ok=True)
+        raise
+
+
+def _acquire_lock(lock_file):
+    """
+    Create `lock_file` for this process and return True, or return False if
+    another process holds it. An abandoned lock (see `_lock_held`) is removed
+    and acquired again.
+    """
+    for _ in range(2):
+        try:
+            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if _lock_held(lock_file):
+                return False
+            lock_file.unlink(missing_ok=True)
+            continue
+        with os.fdopen(fd, 'w') as lock:
+            lock.write(_lock_owner())
+        return True
+    return False
+
+
+def _lock_held(lock_file):
+    """
+    Tell whether `lock_file` exists and was taken by a process that may still
+    be compiling: one on another host, or one still running on this host,
+    unless the lock is older than `LOCK_TIMEOUT_S`.
+    """
+    try:
+        age = time.time() - lock_file.stat().st_mtime
+        owner = lock_file.read_text().split()
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return True
+
+    if age > LOCK_TIMEOUT_S:
+        return False
+    if len(owner) != 2 or owner[0] != socket.gethostname():
+        # Being written, or taken on another host
+        return True
+    try:
+        os.kill(int(owner[1]), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        pass
+    return True
+
+
+def _lock_owner():
+    return f'{socket.gethostname()} {os.getpid()}'
+
+
+def _main():
+    """
+    Compile the kernel described by the JSON spec given as argument, holding
+    its lock file until done.
+    """
+    from xsuite.kernel_definitions import NAME_CLASS_MAP
+    from xsuite.prebuild_kernels import _compile_into_user_cache
+
+    spec = json.loads(sys.argv[1])
+    lock_file = Path(spec['lock_file'])
+    try:
+        lock_file.write_text(_lock_owner())
+        tracker_element_classes = [
+            NAME_CLASS_MAP[name]._XoStruct for name in spec['tracker_element_classes']]
+        classes = [NAME_CLASS_MAP[name] for name in spec['classes']]
+        result = _compile_into_user_cache(
+            spec['config'], tracker_element_classes, classes, spec['context'])
+    finally:
+        lock_file.unlink(missing_ok=True)
+    if result is None:
+        sys.exit('The kernel could not be compiled into the user kernel cache.')
+
+
+if __name__ == '__main__':
+    _main()
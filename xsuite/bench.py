@@ -0,0 +1,300 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Tracking throughput benchmark of the installed prebuilt kernels, run by
+`xsuite-prebuild bench`.
+
+Every kernel reported by `enumerate_kernels` tracks the lines of
+`xsuite.workloads.BENCHMARK_LINES` that it provides the elements and config
+for. Each kernel and line is measured in a fresh interpreter, which records the
+first-call latency (loading the kernel and tracking one turn), the throughput
+in particle-turns per second for each number of particles, and its own peak
+resident memory:
+
+    python -m xsuite.bench '<JSON benchmark spec>'
+
+The results can be saved as JSON and compared against a baseline saved in the
+same way, e.g. with a previous xsuite release or on another node type.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from xsuite.prebuild_kernels import (
+    OPENMP_CONTEXT, PREBUILT_KERNELS_LOCATION, SERIAL_CONTEXT, _print,
+)
+
+DEFAULT_PARTICLE_COUNTS = (100, 1000, 10000)
+DEFAULT_N_TURNS = 10
+DEFAULT_N_CELLS = 10
+DEFAULT_TOLERANCE = 0.1
+
+
+def run_benchmarks(
+        kernels=None,
+        lines=None,
+        particle_counts=DEFAULT_PARTICLE_COUNTS,
+        n_turns=DEFAULT_N_TURNS,
+        n_cells=DEFAULT_N_CELLS,
+        contexts=(SERIAL_CONTEXT, OPENMP_CONTEXT),
+):
+    """
+    Benchmark the installed kernels, optionally only the module names in
+    `kernels` and the benchmark lines in `lines`, and return the results as a
+    JSON-serializable dict.
+    """
+    from xsuite.prebuild_kernels import enumerate_kernels, _current_package_versions
+    from xsuite.workloads import BENCHMARK_LINES
+
+    if lines is None:
+        lines = list(BENCHMARK_LINES)
+    unknown_lines = set(lines) - set(BENCHMARK_LINES)
+    if unknown_lines:
+        raise ValueError(f'Unknown benchmark line(s) {", ".join(sorted(unknown_lines))}; '
+                         f'expected some of {", ".join(BENCHMARK_LINES)}.')
+
+    results = []
+    for module_name, metadata in enumerate_kernels():
+        if kernels is not None and module_name not in kernels:
+            continue
+        if metadata['context'] not in contexts:
+            continue
+
+        for line_name in lines:
+            _, required_config = BENCHMARK_LINES[line_name]
+            if any(metadata['config'].get(key, False) != value
+                   for key, value in required_config.items()):
+                continue
+
+            spec = {
+                'module_name': module_name,
+                'location': str(PREBUILT_KERNELS_LOCATION),
+                'context': metadata['context'],
+                'config': metadata['config'],
+                'tracker_element_classes': metadata['tracker_element_classes'],
+                'line': line_name,
+                'n_cells': n_cells,
+                'particle_counts': list(particle_counts),
+                'n_turns': n_turns,
+            }
+            _print(f'Benchmarking `{module_name}` on the `{line_name}` line...')
+            measurement = _run_in_subprocess(spec)
+            if 'skipped' in measurement:
+                _print(f'Skipped: {measurement["skipped"]}')
+                continue
+
+            for n_particles, rate in measurement['particle_turns_per_s'].items():
+                results.append({
+                    'kernel': module_name,
+                    'context': metadata['context'],
+                    'line': line_name,
+                    'n_particles': int(n_particles),
+                    'n_turns': n_turns,
+                    'particle_turns_per_s': rate,
+                    'first_call_s': measurement['first_call_s'],
+                    'peak_rss_bytes': measurement['peak_rss_bytes'],
+                })
+
+    return {
+        'host': _host_info(),
+        'versions': _current_package_versions(),
+        'results': results,
+    }
+
+
+def record_benchmarks(results, location=PREBUILT_KERNELS_LOCATION):
+    """
+    Save the throughput of each kernel in `results`, as returned by
+    `run_benchmarks`, under 'benchmark' in its metadata: for each line, the
+    particle-turns per second with the largest number of particles. Kernel
+    selection uses these measurements, see `_kernel_costs`.
+    """
+    from xsuite.prebuild_kernels import (
+        _existing_metadata, invalidate_kernel_cache, save_kernel_index,
+    )
+
+    measurements = {}
+    for entry in results['results']:
+        kernel_lines = measurements.setdefault(entry['kernel'], {})
+        n_particles, _ = kernel_lines.get(entry['line'], (-1, None))
+        if entry['n_particles'] > n_particles:
+            kernel_lines[entry['line']] = (
+                entry['n_particles'], entry['particle_turns_per_s'])
+
+    location = Path(location)
+    for module_name, kernel_lines in measurements.items():
+        metadata_file = location / f'{module_name}.json'
+        metadata = _existing_metadata(metadata_file)
+        if not metadata:
+            continue
+        metadata['benchmark'] = {
+            line: round(rate) for line, (_, rate) in sorted(kernel_lines.items())
+        }
+        tmp_file = metadata_file.with_name(f'.{metadata_file.name}.{os.getpid()}.tmp')
+        with tmp_file.open('w') as fd:
+            json.dump(metadata, fd, indent=4)
+        os.replace(tmp_file, metadata_file)
+
+    save_kernel_index(location)
+    invalidate_kernel_cache()
+
+
+def compare_with_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare the throughput of `results` with that of `baseline`, both as
+    returned by `run_benchmarks`, and return a list of (key, ratio) tuples for
+    the measurements that got slower by more than `tolerance` (a fraction).
+    Measurements missing from either side are ignored.
+    """
+    def by_key(data):
+        return {
+            (entry['kernel'], entry['line'], entry['n_particles']): entry
+            for entry in data['results']
+        }
+
+    baseline_entries = by_key(baseline)
+    regressions = []
+    for key, entry in by_key(results).items():
+        reference = baseline_entries.get(key)
+        if reference is None:
+            continue
+        ratio = entry['particle_turns_per_s'] / reference['particle_turns_per_s']
+        if ratio < 1 - tolerance:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def format_results(results, baseline=None):
+    """Format the results of `run_benchmarks` as a table."""
+    baseline_entries = {}
+    if baseline is not None:
+        baseline_entries = {
+            (entry['kernel'], entry['line'], entry['n_particles']): entry
+            for entry in baseline['results']
+        }
+
+    entries = results['results']
+    kernel_width = max([len('Kernel')] + [len(entry['kernel']) for entry in entries])
+    header = (f'{"Kernel":<{kernel_width}}  {"Line":<11}  {"Particles":>9}  '
+              f'{"Part.turns/s":>12}  {"First call":>10}  {"Peak RSS":>10}')
+    if baseline is not None:
+        header += f'  {"vs baseline":>11}'
+
+    lines = [header]
+    for entry in entries:
+        peak_rss = entry['peak_rss_bytes']
+        peak_rss = '-' if peak_rss is None else f'{peak_rss / 1024 ** 2:.0f} MiB'
+        row = (
+            f'{entry["kernel"]:<{kernel_width}}  {entry["line"]:<11}  '
+            f'{entry["n_particles"]:>9}  {entry["particle_turns_per_s"]:>12.4g}  '
+            f'{entry["first_call_s"]:>8.3f} s  {peak_rss:>10}'
+        )
+        if baseline is not None:
+            reference = baseline_entries.get(
+                (entry['kernel'], entry['line'], entry['n_particles']))
+            if reference is None:
+                row += f'  {"-":>11}'
+            else:
+                ratio = entry['particle_turns_per_s'] / reference['particle_turns_per_s']
+                row += f'  {(ratio - 1) * 100:>+10.1f}%'
+        lines.append(row)
+    return '\n'.join(lines)
+
+
+def _run_in_subprocess(spec):
+    process = subprocess.run(
+        [sys.executable, '-m', 'xsuite.bench', json.dumps(spec)],
+        capture_output=True, text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(
+            f'Benchmarking `{spec["module_name"]}` on the `{spec["line"]}` line '
+            f'failed:\n{process.stderr}')
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def _benchmark_kernel(spec):
+    """Measure one kernel on one line; run in a fresh interpreter."""
+    import xobjects as xo
+
+    from xsuite.workloads import BENCHMARK_LINES, attach_kernel, ring_particles
+
+    if spec['context'] == SERIAL_CONTEXT:
+        context = xo.ContextCpu()
+    else:
+        context = xo.ContextCpu(omp_num_threads='auto')
+
+    build_line, _ = BENCHMARK_LINES[spec['line']]
+    line = build_line(spec['n_cells'])
+    line.build_tracker(_context=context, compile=False)
+
+    line_classes = {cls._DressingClass.__name__
+                    for cls in line.tracker.line_element_classes}
+    missing_classes = line_classes - set(spec['tracker_element_classes'])
+    if missing_classes:
+        return {'skipped': f'`{spec["module_name"]}` does not provide '
+                           f'{", ".join(sorted(missing_classes))}.'}
+
+    particle_counts = spec['particle_counts']
+    n_turns = spec['n_turns']
+
+    start_time = time.perf_counter()
+    attach_kernel(line, spec['module_name'], spec['location'], spec['config'],
+                  spec['tracker_element_classes'])
+    particles = ring_particles(line, particle_counts[0], _context=context)
+    line.track(particles, num_turns=1)
+    first_call = time.perf_counter() - start_time
+
+    rates = {}
+    for n_particles in particle_counts:
+        particles = ring_particles(line, n_particles, _context=context)
+        start_time = time.perf_counter()
+        line.track(particles, num_turns=n_turns)
+        rates[n_particles] = n_particles * n_turns / (time.perf_counter() - start_time)
+
+    return {
+        'first_call_s': first_call,
+        'particle_turns_per_s': rates,
+        'peak_rss_bytes': _peak_rss(),
+    }
+
+
+def _peak_rss():
+    """Return the peak resident memory of this process in bytes, if known."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux, but in bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _host_info():
+    cpu_model = platform.processor()
+    try:
+        with open('/proc/cpuinfo', 'r') as fd:
+            for line in fd:
+                if line.startswith('model name'):
+                    cpu_model = line.split(':', 1)[1].strip()
+                    break
+    except OSError:  # Not Linux
+        pass
+
+    return {
+        'machine': platform.machine(),
+        'cpu_model': cpu_model,
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+    }
+
+
+if __name__ == '__main__':
+    print(json.dumps(_benchmark_kernel(json.loads(sys.argv[1]))))
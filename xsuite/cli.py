@@ -3,17 +3,35 @@
 # Copyright (c) CERN, 2024.                 #
 # ######################################### #
 import argparse
+import os
 from importlib.metadata import version
 
 from xsuite.prebuild_kernels import (
-    clear_kernels, regenerate_kernels, PREBUILT_KERNELS_LOCATION,
+    build_kernel_from_line, clear_kernels, kernel_search_path, regenerate_kernels,
+    PREBUILT_KERNELS_LOCATION,
     SERIAL_CONTEXT, OPENMP_CONTEXT,
 )
 
 
 def regenerate_command(args):
+    if args.from_line:
+        build_kernel_from_line(
+            args.from_line,
+            context=args.kind,
+            incremental=args.incremental,
+            jobs_per_kernel=args.jobs_per_kernel,
+        )
+        return
+
     n_threads = args.threads
-    regenerate_kernels(n_threads=n_threads, context=args.kind)
+    regenerate_kernels(
+        n_threads=n_threads,
+        context=args.kind,
+        incremental=args.incremental,
+        jobs_per_kernel=args.jobs_per_kernel,
+        start_method=args.start_method,
+        pgo=args.pgo,
+    )
 
 
 def clean_command(args):
@@ -21,10 +39,64 @@ def clean_command(args):
     print('Cleaned kernels.')
 
 
+def bench_command(args):
+    import json
+    import sys
+
+    from xsuite.bench import (
+        compare_with_baseline, format_results, record_benchmarks, run_benchmarks,
+    )
+
+    results = run_benchmarks(
+        kernels=args.kernels,
+        lines=args.lines,
+        particle_counts=args.particles,
+        n_turns=args.turns,
+        contexts=args.kind,
+    )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r') as fd:
+            baseline = json.load(fd)
+
+    print(format_results(results, baseline))
+    if args.output:
+        with open(args.output, 'w') as fd:
+            json.dump(results, fd, indent=4)
+    if args.record:
+        record_benchmarks(results)
+
+    if baseline is not None:
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        for (kernel, line, n_particles), ratio in regressions:
+            print(f'Regression: `{kernel}` on the `{line}` line with '
+                  f'{n_particles} particles is {(1 - ratio) * 100:.1f}% slower.')
+        if regressions:
+            sys.exit(1)
+
+
+def calibrate_command(args):
+    from xsuite.auto_context import calibrate, choose_cpu_context
+
+    calibration = calibrate(thread_counts=args.threads)
+    if calibration['serial'] is None and not calibration['openmp']:
+        print('No prebuilt kernel can run the calibration line.')
+        return
+
+    print(f'{"Particles":>9}  {"Elements":>8}  {"Context":<8}  {"Threads":>7}')
+    for n_particles in (100, 1000, 10000, 100000, 1000000):
+        for n_elements in (100, 10000):
+            choice = choose_cpu_context(n_particles, n_elements, calibration)
+            print(f'{n_particles:>9}  {n_elements:>8}  {choice["context"]:<8}  '
+                  f'{choice["omp_num_threads"] or "-":>7}')
+
+
 def info_command(args):
     version_str = version("xsuite")
     print(f'Xsuite version {version_str}')
     print(f'Kernels location: {PREBUILT_KERNELS_LOCATION}')
+    print(f'Kernel search path: {os.pathsep.join(map(str, kernel_search_path()))}')
 
 
 def parse_kind_argument(value):
@@ -45,6 +117,18 @@ def parse_kind_argument(value):
     return tuple(kinds)
 
 
+def parse_list_argument(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def parse_int_list_argument(value):
+    try:
+        return [int(item) for item in parse_list_argument(value)]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f'expected a comma-separated list of integers, got `{value}`')
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog='xsuite-prebuild',
@@ -74,8 +158,99 @@ def main():
         default=(SERIAL_CONTEXT,),
         help='build `serial`, `openmp`, or both with `serial,openmp`',
     )
+    regenerate_parser.add_argument(
+        '-i', '--incremental',
+        help='only rebuild the kernels whose sources, flags, config or '
+             'package versions changed',
+        action='store_true',
+    )
+    regenerate_parser.add_argument(
+        '-j', '--jobs-per-kernel',
+        type=int,
+        help='specify the number of concurrent compiler jobs for each kernel '
+             '(default: share the available CPUs between the kernels built '
+             'at the same time)',
+    )
+    regenerate_parser.add_argument(
+        '--from-line',
+        metavar='LINE_JSON',
+        help='instead of the default kernels, build a slim kernel with only '
+             'the element classes and config of the line saved in this file',
+    )
+    regenerate_parser.add_argument(
+        '--pgo',
+        help='build the kernels with profile-guided optimization, trained on '
+             'a bundled tracking workload (requires GCC)',
+        action='store_true',
+    )
+    regenerate_parser.add_argument(
+        '--start-method',
+        choices=('forkserver', 'spawn'),
+        help='specify how the build workers are started (default: '
+             '`forkserver` where available, which imports Xsuite only once)',
+    )
     regenerate_parser.set_defaults(func=regenerate_command)
 
+    # `bench` command
+    bench_parser = subparsers.add_parser(
+        'bench',
+        aliases=['b'],
+        description='Measure the tracking throughput of the installed kernels.',
+    )
+    bench_parser.add_argument(
+        '--kernels',
+        type=parse_list_argument,
+        help='comma-separated module names of the kernels to benchmark '
+             '(default: all)',
+    )
+    bench_parser.add_argument(
+        '--lines',
+        type=parse_list_argument,
+        help='comma-separated benchmark lines among `thin`, `thick`, '
+             '`collimation` and `radiation` (default: all)',
+    )
+    bench_parser.add_argument(
+        '--particles',
+        type=parse_int_list_argument,
+        default=(100, 1000, 10000),
+        help='comma-separated numbers of particles (default: 100,1000,10000)',
+    )
+    bench_parser.add_argument(
+        '--turns',
+        type=int,
+        default=10,
+        help='number of turns of each measurement (default: 10)',
+    )
+    bench_parser.add_argument(
+        '--kind',
+        type=parse_kind_argument,
+        default=(SERIAL_CONTEXT, OPENMP_CONTEXT),
+        help='benchmark `serial`, `openmp` kernels, or both (default)',
+    )
+    bench_parser.add_argument(
+        '-o', '--output',
+        help='save the results to this JSON file',
+    )
+    bench_parser.add_argument(
+        '--record',
+        help='save the throughput of each kernel in its metadata, where kernel '
+             'selection uses it to prefer the fastest kernel',
+        action='store_true',
+    )
+    bench_parser.add_argument(
+        '--baseline',
+        help='compare with the results saved in this JSON file, and exit '
+             'with an error if a measurement got slower',
+    )
+    bench_parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.1,
+        help='slowdown relative to the baseline tolerated before reporting '
+             'a regression (default: 0.1)',
+    )
+    bench_parser.set_defaults(func=bench_command)
+
     # `clean` command
     clean_parser = subparsers.add_parser(
         'clean',
@@ -95,6 +270,20 @@ def main():
     )
     clean_parser.set_defaults(func=clean_command)
 
+    # `calibrate` command
+    calibrate_parser = subparsers.add_parser(
+        'calibrate',
+        description='Measure the serial and OpenMP kernels on this host, for '
+                    'the automatic choice of the context and number of threads.',
+    )
+    calibrate_parser.add_argument(
+        '--threads',
+        type=parse_int_list_argument,
+        help='comma-separated numbers of OpenMP threads to measure (default: '
+             'powers of two up to the number of available CPUs)',
+    )
+    calibrate_parser.set_defaults(func=calibrate_command)
+
     # `info` command
     info_parser = subparsers.add_parser(
         'info',
@@ -0,0 +1,119 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Process-wide counters and timings of prebuilt kernel selection, loading and
+compilation, reported by `xsuite.kernel_stats()`.
+
+Setting the environment variable `XSUITE_KERNEL_TRACE` to a file name also
+appends every event to that file as a line of JSON, tagged with the process
+id, so that the traces of several processes can be written to the same file
+and aggregated afterwards.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+KERNEL_TRACE_ENV = 'XSUITE_KERNEL_TRACE'
+
+# Why a lookup found no suitable kernel: the rejection of the closest candidate
+# (wrong context, different config, missing classes), or why there was no
+# candidate at all (incompatible package versions, missing binaries, no kernel).
+MISS_REASONS = (
+    'context', 'config', 'classes', 'version', 'missing_binary', 'no_kernel', 'forced',
+)
+TIMED_STEPS = ('scan', 'match', 'load', 'compile', 'preload')
+
+_LOCK = threading.Lock()
+_STATS = {}
+
+
+def kernel_stats() -> dict:
+    """
+    Return a snapshot of the counters of this process: the number of kernel
+    lookups, of hits and of misses by reason (see `MISS_REASONS`), and for
+    each step (see `TIMED_STEPS`) the number of times it ran and the total
+    time spent in it. Misses are lookups after which Xtrack compiles the
+    kernel itself.
+    """
+    with _LOCK:
+        return {
+            'lookups': _STATS['lookups'],
+            'memoized_lookups': _STATS['memoized_lookups'],
+            'hits': _STATS['hits'],
+            'misses': sum(_STATS['misses_by_reason'].values()),
+            'misses_by_reason': dict(_STATS['misses_by_reason']),
+            'hits_by_kernel': dict(_STATS['hits_by_kernel']),
+            'steps': {step: dict(values) for step, values in _STATS['steps'].items()},
+        }
+
+
+def reset_kernel_stats():
+    """Reset all the counters of `kernel_stats`."""
+    with _LOCK:
+        _STATS.clear()
+        _STATS.update(
+            lookups=0,
+            memoized_lookups=0,
+            hits=0,
+            misses_by_reason={reason: 0 for reason in MISS_REASONS},
+            hits_by_kernel={},
+            steps={step: {'count': 0, 'total_s': 0.} for step in TIMED_STEPS},
+        )
+
+
+def record_lookup(module_name, miss_reason, duration, memoized, **details):
+    """Count a kernel lookup, which found `module_name` or failed for `miss_reason`."""
+    with _LOCK:
+        _STATS['lookups'] += 1
+        _STATS['memoized_lookups'] += memoized
+        if module_name is not None:
+            _STATS['hits'] += 1
+            hits_by_kernel = _STATS['hits_by_kernel']
+            hits_by_kernel[module_name] = hits_by_kernel.get(module_name, 0) + 1
+        else:
+            _STATS['misses_by_reason'][miss_reason] += 1
+
+    trace(
+        'lookup',
+        result='hit' if module_name is not None else 'miss',
+        module_name=module_name,
+        reason=miss_reason,
+        memoized=memoized,
+        duration_s=duration,
+        **details,
+    )
+
+
+@contextmanager
+def timed(step, **details):
+    """Add the time spent in the block to `step`, and trace it."""
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start_time
+        with _LOCK:
+            values = _STATS['steps'][step]
+            values['count'] += 1
+            values['total_s'] += duration
+        trace(step, duration_s=duration, **details)
+
+
+def trace(event, **fields):
+    """Append an event to the trace file, if `XSUITE_KERNEL_TRACE` is set."""
+    trace_file = os.environ.get(KERNEL_TRACE_ENV)
+    if not trace_file:
+        return
+
+    record = {'event': event, 'time': time.time(), 'pid': os.getpid(), **fields}
+    line = json.dumps(record, default=str) + '\n'
+    with _LOCK:
+        with open(trace_file, 'a') as fd:
+            fd.write(line)
+
+
+reset_kernel_stats()
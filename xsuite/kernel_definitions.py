@@ -40,6 +40,14 @@ kernel_definitions = [
         'config': BASE_CONFIG,
         'classes': XTRACK_ELEMENTS + DEFAULT_XFIELDS_ELEMENTS + DEFAULT_XCOLL_ELEMENTS,
         'extra_classes': [xt.Particles] + EXTRA_XCOLL_ELEMENTS,
+        'isa_variants': ['x86-64-v3'],
+        'flavors': ['fastmath'],
+    }),
+    ('default_runtime_config', {
+        'config': BASE_CONFIG,
+        'classes': XTRACK_ELEMENTS + DEFAULT_XFIELDS_ELEMENTS + DEFAULT_XCOLL_ELEMENTS,
+        'extra_classes': [xt.Particles] + EXTRA_XCOLL_ELEMENTS,
+        'runtime_config': True,
     }),
     ('all_with_synrad', {
         'config': {**BASE_CONFIG, 'XTRACK_MULTIPOLE_NO_SYNRAD': False},
@@ -0,0 +1,140 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Content-addressed cache of compiled kernel binaries, shared between Python
+environments.
+
+The cache is opt-in: set the environment variable `XSUITE_OBJECT_CACHE` to a
+directory, which may be shared by several environments and users. Entries are
+keyed by the build hash of a kernel (see
+`xsuite.prebuild_kernels._kernel_build_hash`), which covers the generated
+source, the compiler flags and the Python ABI. The total size of the cache is
+kept under `XSUITE_OBJECT_CACHE_SIZE` (for example `500M` or `10G`, default
+5G) by evicting the least recently used entries.
+
+Entries are written to a temporary file and atomically renamed into place,
+so concurrent writers and readers never observe partial files; a reader
+losing an entry to a concurrent eviction just sees a cache miss. A cache that
+cannot be read or written is skipped, and the kernels are compiled as usual.
+"""
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Optional
+
+OBJECT_CACHE_ENV = 'XSUITE_OBJECT_CACHE'
+OBJECT_CACHE_SIZE_ENV = 'XSUITE_OBJECT_CACHE_SIZE'
+DEFAULT_OBJECT_CACHE_SIZE = 5 * 1024 ** 3
+
+_SIZE_SUFFIXES = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+_ENTRY_SUFFIX = '.so'
+
+
+def object_cache_location() -> Optional[Path]:
+    """Return the object cache directory, or None if the cache is disabled."""
+    location = os.environ.get(OBJECT_CACHE_ENV, '').strip()
+    if not location:
+        return None
+    return Path(location).expanduser()
+
+
+def object_cache_size() -> int:
+    """Return the size budget of the object cache in bytes."""
+    value = os.environ.get(OBJECT_CACHE_SIZE_ENV)
+    if value is None or not value.strip():
+        return DEFAULT_OBJECT_CACHE_SIZE
+    return _parse_size(value, OBJECT_CACHE_SIZE_ENV)
+
+
+def fetch(key, target) -> bool:
+    """
+    Copy the binary cached under `key` to `target`. Return False on a cache
+    miss, or if the cache is disabled.
+    """
+    location = object_cache_location()
+    if location is None:
+        return False
+
+    entry = _entry_path(location, key)
+    target = Path(target)
+    tmp_target = target.with_name(f'.{target.name}.{uuid.uuid4().hex}.tmp')
+    try:
+        shutil.copyfile(entry, tmp_target)
+        shutil.copymode(entry, tmp_target)
+        os.replace(tmp_target, target)
+    except OSError:
+        tmp_target.unlink(missing_ok=True)
+        return False
+
+    try:
+        os.utime(entry)  # Mark as recently used
+    except OSError:
+        pass
+    return True
+
+
+def store(key, source):
+    """
+    Add the binary `source` to the cache under `key`, and evict the least
+    recently used entries beyond the size budget. Does nothing if the cache
+    is disabled or cannot be written to.
+    """
+    location = object_cache_location()
+    if location is None:
+        return
+
+    entry = _entry_path(location, key)
+    tmp_entry = entry.with_name(f'.{entry.name}.{uuid.uuid4().hex}.tmp')
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, tmp_entry)
+        shutil.copymode(source, tmp_entry)
+        os.replace(tmp_entry, entry)
+        evict(location, object_cache_size())
+    except OSError:
+        pass
+    finally:
+        try:
+            tmp_entry.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def evict(location, max_size):
+    """Delete the least recently used entries until the cache fits `max_size`."""
+    entries = []
+    for entry in Path(location).glob(f'*/*{_ENTRY_SUFFIX}'):
+        try:
+            stat = entry.stat()
+        except OSError:  # Evicted concurrently
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda item: item[0]):
+        if total_size <= max_size:
+            break
+        entry.unlink(missing_ok=True)
+        total_size -= size
+
+
+def _entry_path(location, key):
+    """Spread the entries over subdirectories, like ccache and git."""
+    return Path(location) / key[:2] / f'{key}{_ENTRY_SUFFIX}'
+
+
+def _parse_size(value, name):
+    """Parse a size such as ``1048576``, ``500M`` or ``10G`` into bytes."""
+    normalized = value.strip().upper().removesuffix('B').removesuffix('I')
+    number, suffix = normalized, ''
+    if normalized and normalized[-1] in _SIZE_SUFFIXES:
+        number, suffix = normalized[:-1], normalized[-1]
+    try:
+        return int(float(number) * _SIZE_SUFFIXES[suffix])
+    except ValueError:
+        raise ValueError(
+            f'Invalid size {value!r} for {name}; expected a number of bytes, '
+            f'optionally followed by K, M, G or T.') from None
@@ -2,24 +2,39 @@
 # This file is part of the Xsuite project.  #
 # Copyright (c) CERN, 2025.                 #
 # ######################################### #
+import hashlib
 import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
 import sysconfig
+import tempfile
+import threading
+import time
 import warnings
-from multiprocessing import get_context
+from contextlib import contextmanager
+from functools import lru_cache
+from multiprocessing import get_all_start_methods, get_context
 from pathlib import Path
 from pprint import pformat
-from typing import Iterator, Optional, Tuple
+from typing import Iterator, NamedTuple, Optional, Tuple
 
-import xcoll as xc
-import xfields as xf
-import xobjects as xo
-import xtrack as xt
-from xtrack.general import _print
+# This module is imported by `xsuite-prebuild` and, lazily, by `import xsuite`.
+# Xobjects, Xtrack, Xfields, Xcoll and the kernel definitions (which import all
+# of them) are therefore only imported inside the functions that need them.
 
-import xsuite as xs
-from xsuite.kernel_definitions import kernel_definitions, NAME_CLASS_MAP
+PREBUILT_KERNELS_LOCATION = Path(__file__).parent / 'lib'
 
-PREBUILT_KERNELS_LOCATION = Path(xs.__file__).parent / 'lib'
+# Besides the kernels bundled with the package, kernels can be looked up in
+# the directories listed in `KERNEL_PATH_ENV` (separated by `os.pathsep`) and
+# in a writable per-user cache, see `kernel_search_path`. The cache defaults to
+# `~/.cache/xsuite/kernels`, and `USER_KERNEL_CACHE_ENV` set to an empty string
+# disables it.
+KERNEL_PATH_ENV = 'XSUITE_KERNEL_PATH'
+USER_KERNEL_CACHE_ENV = 'XSUITE_KERNEL_CACHE'
 
 SERIAL_CONTEXT = 'serial'
 OPENMP_CONTEXT = 'openmp'
@@ -28,6 +43,88 @@ CONTEXT_SUFFIXES = {
     OPENMP_CONTEXT: '_cpu_openmp',
 }
 
+# Instruction set variants that kernel definitions can list under
+# 'isa_variants', from least to most demanding (see `IsaVariant`). Variant
+# kernels get the suffix `_isa_suffix(isa)` after the context suffix, and the
+# best variant that the running CPU supports is preferred.
+class IsaVariant(NamedTuple):
+    compiler_flags: Tuple[str, ...]
+    cpu_features: frozenset  # As named in the flags of /proc/cpuinfo
+
+
+_X86_64_V2_FEATURES = frozenset({
+    'cx16', 'lahf_lm', 'popcnt', 'sse4_1', 'sse4_2', 'ssse3',
+})
+_X86_64_V3_FEATURES = _X86_64_V2_FEATURES | {
+    'abm', 'avx', 'avx2', 'bmi1', 'bmi2', 'f16c', 'fma', 'movbe', 'xsave',
+}
+_X86_64_V4_FEATURES = _X86_64_V3_FEATURES | {
+    'avx512f', 'avx512bw', 'avx512cd', 'avx512dq', 'avx512vl',
+}
+ISA_VARIANTS = {
+    'x86-64-v2': IsaVariant(('-march=x86-64-v2',), _X86_64_V2_FEATURES),
+    'x86-64-v3': IsaVariant(('-march=x86-64-v3',), _X86_64_V3_FEATURES),
+    'x86-64-v4': IsaVariant(('-march=x86-64-v4',), _X86_64_V4_FEATURES),
+}
+
+# Compiler flags of all the prebuilt kernels. Debug information makes up about
+# two thirds of a kernel, and is left out: the shared objects are three times
+# smaller and compile faster, with the same machine code.
+KERNEL_COMPILER_FLAGS = ('-g0',)
+
+# Flavors that kernel definitions can list under 'flavors': kernels built with
+# extra optimization flags that may change results at the level of the last
+# bits. A flavored kernel gets the suffix `_<flavor>` after the instruction set
+# suffix, and is only selected when its flavor is requested explicitly, through
+# `get_suitable_kernel` or the environment variable `KERNEL_FLAVOR_ENV`.
+# `-ffast-math` is spelled out without its finite-math assumptions, and
+# without `-funsafe-math-optimizations`, with which GCC links code that
+# changes the floating point mode of the whole process. Xobjects compiles at
+# `-O3` too, but the flavor does not rely on it.
+KERNEL_FLAVORS = {
+    'fastmath': (
+        '-O3',
+        '-ffp-contract=fast',
+        '-fno-math-errno',
+        '-fno-trapping-math',
+        '-fno-signed-zeros',
+        '-fassociative-math',
+        '-freciprocal-math',
+    ),
+}
+KERNEL_FLAVOR_ENV = 'XSUITE_KERNEL_FLAVOR'
+
+# Custom kernels, built for the element classes and config of a given line (see
+# `build_kernel_from_line`), are named with this prefix. They are tried before
+# the kernels of `kernel_definitions`, the ones with fewer classes first.
+CUSTOM_KERNEL_PREFIX = 'custom_'
+_CUSTOM_KERNEL_PRIORITY = -1_000_000
+
+# Suffix of the kernels built with profile-guided optimization, which comes
+# after the flavor suffix.
+PGO_SUFFIX = '_pgo'
+
+# The consolidated index of all kernel metadata in a kernel directory, see
+# `save_kernel_index`. Bump the version whenever its layout changes.
+KERNEL_INDEX_FILE_NAME = '_index.json'
+KERNEL_INDEX_VERSION = 3
+
+# Process-level caches used by `get_suitable_kernel`. Both are keyed on the
+# state of the kernel directory (see `_kernel_cache_key`), so stale entries are
+# never used; `invalidate_kernel_cache` empties them explicitly.
+_KERNEL_CANDIDATES_CACHE = {}
+# Stands for the value of a config key that a kernel takes at run time, see
+# `xsuite.runtime_config`
+_RUNTIME_VALUE = '<runtime>'
+
+_SUITABLE_KERNEL_MEMO = {}
+_SUITABLE_KERNEL_MEMO_MAX_SIZE = 1024
+
+# Registry assigning a bit to every class name seen in kernel metadata or in a
+# request, so that class-set inclusion checks are integer operations.
+_CLASS_NAME_BITS = {}
+_CLASS_NAME_BITS_LOCK = threading.Lock()
+
 UPDATE_OR_REGENERATE_MESSAGE = (
     'Suggested fixes: update xsuite with `pip install --upgrade xsuite` '
     '(usually faster), or regenerate the kernels with '
@@ -35,11 +132,48 @@ UPDATE_OR_REGENERATE_MESSAGE = (
 )
 
 
+def __getattr__(name: str):
+    # Kept importable from here for backwards compatibility
+    if name in ('kernel_definitions', 'NAME_CLASS_MAP'):
+        from xsuite import kernel_definitions
+        return getattr(kernel_definitions, name)
+
+    raise AttributeError(f"Module {__name__!r} has no attribute {name!r}")
+
+
 class PrebuiltKernelNotFoundError(RuntimeError):
     """Raised when serial CPU execution requires a prebuilt kernel but none matches."""
     pass
 
 
+class _KernelCandidate(NamedTuple):
+    """
+    A usable prebuilt kernel, with its metadata preprocessed for matching.
+
+    Candidates sort in order of preference when they cost the same (see
+    `_kernel_costs`): custom kernels first, then by position in
+    `kernel_definitions`, then kernels with an explicit context first, then
+    flavored kernels first (they are skipped unless requested), then the most
+    demanding instruction set variant first, then profile-guided builds first.
+    The values of the `runtime_keys` of the config (see `xsuite.runtime_config`)
+    are replaced by `_RUNTIME_VALUE` in `config`.
+    """
+    priority: int
+    context_rank: int
+    flavor_rank: int
+    isa_rank: int
+    pgo_rank: int
+    module_name: str
+    metadata: dict
+    context: str
+    config: Optional[frozenset]
+    tracker_class_mask: int
+    class_mask: int
+    flavor: Optional[str]
+    location: Path
+    runtime_keys: Tuple[str, ...]
+
+
 def save_kernel_metadata(
         module_name: str,
         base_module_name: str,
@@ -48,8 +182,26 @@ def save_kernel_metadata(
         tracker_element_classes,
         all_classes,
         location,
+        build_hash=None,
+        build_stats=None,
+        isa=None,
+        pgo=None,
+        flavor=None,
+        custom=False,
+        runtime_config=(),
 ):
-    """Write the JSON metadata that lets runtime lookup validate a kernel."""
+    """
+    Write the JSON metadata that lets runtime lookup validate a kernel.
+
+    `build_stats` records how expensive the compilation was (see
+    `build_single_kernel`), and is used to schedule the next builds. `isa` is
+    the instruction set variant of the kernel (see `ISA_VARIANTS`), if any,
+    `pgo` describes the training run of a profile-guided build, `flavor` is
+    the flavor of the kernel (see `KERNEL_FLAVORS`), if any, `custom`
+    marks kernels that do not come from `kernel_definitions`, and
+    `runtime_config` lists the config keys that the kernel takes at run time
+    (see `xsuite.runtime_config`).
+    """
     location = Path(location)
     out_file = location / f'{module_name}.json'
 
@@ -61,9 +213,86 @@ def save_kernel_metadata(
         'classes': [getattr(cls, '_DressingClass', cls).__name__ for cls in all_classes],
         'versions': _current_package_versions()
     }
-
-    with out_file.open('w') as fd:
+    if build_hash is not None:
+        kernel_metadata['build_hash'] = build_hash
+    if build_stats is not None:
+        kernel_metadata['build'] = build_stats
+    if isa is not None:
+        kernel_metadata['isa'] = isa
+    if pgo is not None:
+        kernel_metadata['pgo'] = pgo
+    if flavor is not None:
+        kernel_metadata['flavor'] = flavor
+    if custom:
+        kernel_metadata['custom'] = True
+    if runtime_config:
+        kernel_metadata['runtime_config'] = list(runtime_config)
+
+    # Replaced rather than rewritten, which updates the modification time of
+    # the directory (see `save_kernel_index`)
+    tmp_file = location / f'.{module_name}.json.{os.getpid()}.tmp'
+    with tmp_file.open('w') as fd:
         json.dump(kernel_metadata, fd, indent=4)
+    os.replace(tmp_file, out_file)
+
+
+def save_kernel_index(location=PREBUILT_KERNELS_LOCATION, kernel_order=None,
+                      base_config=None):
+    """
+    Write the consolidated index of all the kernel metadata in `location`.
+
+    At runtime the index replaces opening every per-kernel JSON file, which
+    is slow on network filesystems. The per-kernel files remain the source of
+    truth: the index takes the modification time of the directory, and is
+    ignored when the directory was modified since, or when it does not list
+    exactly the metadata files present in the directory. The metadata files
+    are always replaced rather than rewritten, which modifies the directory.
+    The index also records the
+    `kernel_order` of the base module names in `kernel_definitions`, and their
+    `base_config`, the default tracker config of Xtrack, for `xsuite.preload`
+    to read without importing them. When they are not given, they are kept
+    from the previous index, so that e.g. `clear_kernels` does not import the
+    definitions either.
+    """
+    location = Path(location)
+    if kernel_order is None:
+        previous_order, base_config = _read_kernel_order(location)
+        kernel_order = sorted(previous_order, key=previous_order.get)
+
+    kernels = []
+    for metadata_file in _iter_kernel_metadata_files(location):
+        entry = {'metadata_file': metadata_file.name}
+        try:
+            module_name, kernel_metadata, explicit_context = _read_kernel_metadata(
+                metadata_file
+            )
+        except Exception as err:
+            entry['error'] = str(err)
+            kernels.append(entry)
+            continue
+
+        entry.update({
+            'module_name': module_name,
+            'explicit_context': explicit_context,
+            'metadata': kernel_metadata,
+        })
+        kernels.append(entry)
+
+    index = {
+        'index_version': KERNEL_INDEX_VERSION,
+        'kernel_order': list(kernel_order),
+        'base_config': base_config,
+        'kernels': kernels,
+    }
+
+    # Write to a temporary file first, so that readers never see a partial index
+    index_file = location / KERNEL_INDEX_FILE_NAME
+    tmp_file = location / f'{KERNEL_INDEX_FILE_NAME}.{os.getpid()}.tmp'
+    with tmp_file.open('w') as fd:
+        json.dump(index, fd, separators=(',', ':'))
+    os.replace(tmp_file, index_file)
+    directory_mtime = location.stat().st_mtime_ns
+    os.utime(index_file, ns=(directory_mtime, directory_mtime))
 
 def enumerate_kernels(verbose=False) -> Iterator[Tuple[str, dict]]:
     """
@@ -72,8 +301,8 @@ def enumerate_kernels(verbose=False) -> Iterator[Tuple[str, dict]]:
     and the second is a dictionary with the kernel metadata.
     """
     candidates, _ = _find_kernel_candidates(verbose=verbose)
-    for _, _, module_name, kernel_metadata in sorted(candidates):
-        yield module_name, kernel_metadata
+    for candidate in candidates:
+        yield candidate.module_name, candidate.metadata
 
 
 def get_suitable_kernel(
@@ -82,6 +311,9 @@ def get_suitable_kernel(
         classes,
         context=None,
         verbose=None,
+        flavor=None,
+        search_path=None,
+        background=None,
 ) -> Optional[Tuple[str, list]]:
     """
     Given a configuration and a list of element classes, return a tuple with
@@ -91,7 +323,40 @@ def get_suitable_kernel(
     When `verbose` is None, diagnostics are controlled by
     `xobjects.settings.show_kernel_diagnostics`, or equivalently the
     environment variable `XSUITE_SHOW_KERNEL_DIAGNOSTICS`.
+
+    Flavored kernels (see `KERNEL_FLAVORS`), which do not give bit-identical
+    results, are only considered when `flavor` names their flavor. When
+    `flavor` is None, it is read from the environment variable
+    `XSUITE_KERNEL_FLAVOR`. Regular kernels remain a fallback in any case.
+
+    The result also gives the 'containing_dir' of the kernel. By default, all
+    the directories of `kernel_search_path` are searched, the user kernel
+    cache included, and a kernel found outside `PREBUILT_KERNELS_LOCATION`,
+    where Xtrack loads kernels from, is linked into it (see
+    `_link_into_prebuilt_location`); only `PREBUILT_KERNELS_LOCATION` is
+    searched when it cannot be written to, or with `search_path` False.
+    Callers loading the kernel from 'containing_dir' can set `search_path`
+    to True, to get it from the search path without linking it. With
+    `search_path` True, a kernel that is not found is also compiled into the
+    user kernel cache if compilation is allowed, so that later processes
+    find it there.
+
+    With `background`, or when it is None and the environment variable
+    `XSUITE_BACKGROUND_COMPILE` is set, a kernel that is not found and would
+    be compiled is compiled by a background process instead, while a more
+    generic prebuilt kernel is returned if there is one; see
+    `xsuite.background_build`.
+
+    Results are memoized for the lifetime of the process, and recomputed when
+    the content of the kernel directory changes; see `invalidate_kernel_cache`.
+    Every lookup is counted in `xsuite.kernel_stats()`.
     """
+    import xobjects as xo
+
+    from xsuite import instrumentation
+    from xsuite.background_build import background_compile_requested
+
+    start_time = time.perf_counter()
     if verbose is None:
         verbose = xo.settings.show_kernel_diagnostics
 
@@ -102,6 +367,8 @@ def get_suitable_kernel(
                    'xobjects.settings.force_kernel_compilation, or '
                    'equivalently the environment variable '
                    'XSUITE_FORCE_KERNEL_COMPILATION.')
+        instrumentation.record_lookup(
+            None, 'forced', time.perf_counter() - start_time, memoized=False)
         return
 
     requested_tracker_class_names = [
@@ -109,127 +376,280 @@ def get_suitable_kernel(
     ]
     requested_class_names = [getattr(cls, '_DressingClass', cls).__name__ for cls in classes]
     requested_classes = list(tracker_element_classes) + list(classes)
-    requested_context = None
-    if isinstance(context, xo.ContextCpu):
-        requested_context = OPENMP_CONTEXT if context.openmp_enabled else SERIAL_CONTEXT
-    rejection_reasons = []
-    candidates, diagnostics = _find_kernel_candidates(verbose=verbose)
-
-    for _, _, module_name, kernel_metadata in sorted(candidates):
-        if verbose:
-            _print(
-                f"==> Considering the precompiled kernel `{module_name}`...")
+    requested_context = _requested_context(context)
+
+    requested_flavor = _requested_kernel_flavor(flavor)
+
+    locations = _lookup_locations(search_path)
+
+    frozen_config = _freeze_config(config)
+    memo_key = None
+    if frozen_config is not None:
+        memo_key = (
+            _kernel_cache_key(locations),
+            frozen_config,
+            frozenset(requested_tracker_class_names),
+            frozenset(requested_class_names),
+            requested_context,
+            requested_flavor,
+        )
 
-        kernel_context = kernel_metadata.get('context', SERIAL_CONTEXT)
-        if requested_context is not None and kernel_context != requested_context:
-            rejection_reasons.append(
-                (
-                    (3000, module_name), # Used for sorting the rejection reasons
-                                         # to ease reporting
-                    f'`{module_name}` was built for context `{kernel_context}`, '
-                    f'but context `{requested_context}` was requested.'
-                )
+    memo = None
+    if memo_key is not None and not verbose:
+        memo = _SUITABLE_KERNEL_MEMO.get(memo_key)
+    memoized = memo is not None
+
+    if memo is None:
+        candidates, diagnostics = _find_kernel_candidates(
+            verbose=verbose, locations=locations)
+        with instrumentation.timed('match'):
+            match, closest_rejection_reason, closest_category = _select_kernel(
+                candidates=candidates,
+                config=config,
+                frozen_config=frozen_config,
+                requested_tracker_class_names=requested_tracker_class_names,
+                requested_class_names=requested_class_names,
+                requested_context=requested_context,
+                requested_flavor=requested_flavor,
+                verbose=verbose,
             )
-            if verbose:
-                _print(
-                    f'The kernel `{module_name}` is unsuitable. Its context '
-                    f'is `{kernel_context}`, but the requested one is '
-                    f'`{requested_context}`.')
-            continue
+        miss_reason = None
+        if match is None:
+            miss_reason = _miss_reason(closest_category, diagnostics)
+        memo = (match, closest_rejection_reason, miss_reason, diagnostics)
+        if memo_key is not None:
+            if len(_SUITABLE_KERNEL_MEMO) >= _SUITABLE_KERNEL_MEMO_MAX_SIZE:
+                _SUITABLE_KERNEL_MEMO.clear()
+            _SUITABLE_KERNEL_MEMO[memo_key] = memo
+
+    match, closest_rejection_reason, miss_reason, diagnostics = memo
+    if match is not None and search_path is None:
+        match = _link_into_prebuilt_location(match)
+        if match is None:
+            return get_suitable_kernel(
+                config, tracker_element_classes, classes, context=context,
+                verbose=verbose, flavor=flavor, search_path=False,
+                background=background)
+    if match is not None:
+        preload = sys.modules.get('xsuite.preload')
+        if preload is not None:
+            # Let a preload in progress finish, rather than loading twice
+            preload.wait_for_kernel(match[0])
+        if not _bind_runtime_config(match, config):
+            # Another thread took the kernel with other values meanwhile
+            _SUITABLE_KERNEL_MEMO.pop(memo_key, None)
+            match, miss_reason = None, 'config'
+            closest_rejection_reason = (
+                f'`{memo[0][0]}` is already in use with other values of '
+                f'{", ".join(memo[0][3])}.')
+    instrumentation.record_lookup(
+        match[0] if match is not None else None,
+        miss_reason,
+        time.perf_counter() - start_time,
+        memoized=memoized,
+        context=requested_context,
+    )
+    if match is not None:
+        return _suitable_kernel_result(match)
 
-        if kernel_metadata['config'] != config:
-            lhs = kernel_metadata['config']
-            rhs = config
-            config_diff = {kk: (lhs.get(kk), rhs.get(kk))
-                           for kk in set(lhs.keys()) | set(rhs.keys())
-                           if lhs.get(kk) != rhs.get(kk)}
-            rejection_reasons.append(
-                (
-                    (2000 + len(config_diff), module_name),
-                    f'`{module_name}` has a different configuration '
-                    f'({len(config_diff)} differing key(s): '
-                    f'{", ".join(sorted(config_diff.keys())) or "none"}).'
-                )
-            )
-            if verbose:
-                _print(
-                    f'The kernel `{module_name}` is unsuitable. Its config '
-                    f'(left) and the requested one (right) differ at the '
-                    f'following keys:\n'
-                    f'{pformat(config_diff)}')
-                _print(
-                    f'Skipping class compatibility check for `{module_name}`.')
+    if not xo.context_cpu.require_prebuilt_kernel(
+            context=context, classes=requested_classes):
+        if requested_context is not None and background_compile_requested(background):
+            fallback = _fallback_with_background_build(
+                config, tracker_element_classes, classes, requested_context,
+                requested_flavor, locations)
+            if fallback is not None:
+                return fallback
+        if search_path and requested_context is not None:
+            return _compile_into_user_cache(
+                config, tracker_element_classes, classes, requested_context)
+        return None
 
-            continue
+    raise PrebuiltKernelNotFoundError(
+        _build_no_suitable_kernel_message(
+            requested_context=requested_context,
+            diagnostics=diagnostics,
+            closest_rejection_reason=closest_rejection_reason,
+        )
+    )
 
-        if verbose:
-            _print(f'The kernel `{module_name}` has the right config.')
 
-        module_tracker_element_names = kernel_metadata['tracker_element_classes']
-        module_class_names = kernel_metadata['classes']
+def _fallback_with_background_build(
+        config, tracker_element_classes, classes, context_key, flavor, locations):
+    """
+    Start compiling the requested kernel in the background, and return the
+    cheapest kernel of `locations` that can stand in for it until then, like
+    `get_suitable_kernel` does. Return None, without starting the compilation,
+    if there is no such kernel or if the compilation cannot be started.
+    """
+    from xsuite import instrumentation
+    from xsuite.background_build import start_background_build
+    from xsuite.runtime_config import OPTIONAL_FEATURE_FLAGS
+
+    candidates, _ = _find_kernel_candidates(locations=locations)
+    match, _, _ = _select_kernel(
+        candidates=candidates,
+        config=config,
+        frozen_config=_freeze_config(config),
+        requested_tracker_class_names=[
+            cls._DressingClass.__name__ for cls in tracker_element_classes],
+        requested_class_names=[
+            getattr(cls, '_DressingClass', cls).__name__ for cls in classes],
+        requested_context=context_key,
+        requested_flavor=flavor,
+        optional_flags=OPTIONAL_FEATURE_FLAGS,
+    )
+    if match is None:
+        return None
+    build = start_background_build(config, tracker_element_classes, classes, context_key)
+    if build is None or not _bind_runtime_config(match, config):
+        return None
 
-        if not set(requested_tracker_class_names) <= set(module_tracker_element_names):
-            class_diff = set(requested_tracker_class_names) - set(module_tracker_element_names)
-            rejection_reasons.append(
-                (
-                    (1000 + len(class_diff), module_name),
-                    f'`{module_name}` is missing requested tracker element '
-                    f'class(es): {", ".join(sorted(class_diff))}.'
-                )
-            )
-            if verbose:
-                _print(
-                    f'The kernel `{module_name}` is unsuitable. It does not '
-                    f'provide the following requested classes: '
-                    f'{", ".join(class_diff)}.')
-            continue
+    instrumentation.trace('fallback', module_name=match[0],
+                          background_build=build.module_name)
+    return _suitable_kernel_result(match)
 
-        all_class_names = set(module_tracker_element_names) | set(module_class_names)
-        if not set(requested_class_names) <= all_class_names:
-            class_diff = set(requested_class_names) - all_class_names
-            rejection_reasons.append(
-                (
-                    (1000 + len(class_diff), module_name),
-                    f'`{module_name}` is missing requested class(es): '
-                    f'{", ".join(sorted(class_diff))}.'
+
+def get_suitable_kernels(
+        requests,
+        verbose=None,
+        flavor=None,
+        search_path=None,
+        background=None,
+) -> list:
+    """
+    Look up the kernels of several lines at once, e.g. the rings of a collider
+    or the branches of an `xtrack.pipeline.MultiTracker`, and return the
+    results of `get_suitable_kernel` for each of the `requests`, in the same
+    order. A request is a tuple (config, tracker_element_classes, classes,
+    context), or a dict with these keys, and the other arguments are those of
+    `get_suitable_kernel`.
+
+    The requests with the same context and config are served by the cheapest
+    kernel that provides the classes of all of them, if there is one, so that
+    the process loads a single kernel for them. The kernel directories are
+    scanned once for all of them. The requests left are looked up one by one.
+    """
+    import xobjects as xo
+
+    from xsuite import instrumentation
+
+    if verbose is None:
+        verbose = xo.settings.show_kernel_diagnostics
+
+    requests = [_kernel_request(request) for request in requests]
+    results = [None] * len(requests)
+    pending = set(range(len(requests)))
+
+    groups = {}
+    for idx, request in enumerate(requests):
+        frozen_config = _freeze_config(request['config'])
+        if frozen_config is not None:
+            context_key = _requested_context(request['context'])
+            groups.setdefault((context_key, frozen_config), []).append(idx)
+    groups = {key: indices for key, indices in groups.items() if len(indices) > 1}
+
+    if groups and not xo.settings.force_kernel_compilation:
+        locations = _lookup_locations(search_path)
+        requested_flavor = _requested_kernel_flavor(flavor)
+        candidates, _ = _find_kernel_candidates(verbose=verbose, locations=locations)
+
+        for (context_key, frozen_config), indices in groups.items():
+            start_time = time.perf_counter()
+            config = requests[indices[0]]['config']
+            tracker_class_names, class_names = {}, {}
+            for idx in indices:
+                for cls in requests[idx]['tracker_element_classes']:
+                    tracker_class_names[cls._DressingClass.__name__] = None
+                for cls in requests[idx]['classes']:
+                    class_names[getattr(cls, '_DressingClass', cls).__name__] = None
+
+            with instrumentation.timed('match'):
+                match, _, _ = _select_kernel(
+                    candidates=candidates,
+                    config=config,
+                    frozen_config=frozen_config,
+                    requested_tracker_class_names=list(tracker_class_names),
+                    requested_class_names=list(class_names),
+                    requested_context=context_key,
+                    requested_flavor=requested_flavor,
+                    verbose=verbose,
                 )
-            )
-            if verbose:
-                _print(
-                    f'The kernel `{module_name}` is unsuitable. It does not '
-                    f'provide the following requested classes: '
-                    f'{", ".join(class_diff)}.')
-            continue
+            if match is not None and search_path is None:
+                match = _link_into_prebuilt_location(match)
+            if match is None:
+                continue
+            preload = sys.modules.get('xsuite.preload')
+            if preload is not None:
+                preload.wait_for_kernel(match[0])
+            if not _bind_runtime_config(match, config):
+                continue
 
-        tracker_element_classes = []
-        for ccnn in module_tracker_element_names:
-            cc = NAME_CLASS_MAP.get(ccnn, None)
-            if cc is None:
-                raise ValueError(f'Class `{ccnn}` from kernel `{module_name}` is not available in the current version of xsuite.')
-            tracker_element_classes.append(cc)
-        if verbose:
-            _print(f'Found suitable prebuilt kernel `{module_name}`.')
+            duration = (time.perf_counter() - start_time) / len(indices)
+            for idx in indices:
+                instrumentation.record_lookup(
+                    match[0], None, duration, memoized=False, context=context_key)
+                results[idx] = _suitable_kernel_result(match)
+                pending.discard(idx)
+
+    for idx in sorted(pending):
+        results[idx] = get_suitable_kernel(
+            **requests[idx],
+            verbose=verbose,
+            flavor=flavor,
+            search_path=search_path,
+            background=background,
+        )
+    return results
+
+
+def _kernel_request(request):
+    """Return a request of `get_suitable_kernels` as keyword arguments."""
+    if isinstance(request, dict):
         return {
-            'module_name': module_name,
-            'tracker_element_classes': tracker_element_classes,
+            'config': request['config'],
+            'tracker_element_classes': request['tracker_element_classes'],
+            'classes': request.get('classes', ()),
+            'context': request.get('context'),
         }
+    config, tracker_element_classes, classes, context = request
+    return {
+        'config': config,
+        'tracker_element_classes': tracker_element_classes,
+        'classes': classes,
+        'context': context,
+    }
 
-    if verbose:
-        _print('==> No suitable precompiled kernel found.')
 
-    if not xo.context_cpu.require_prebuilt_kernel(
-            context=context, classes=requested_classes):
-        return None
+def _requested_context(context):
+    """Return the context key of an Xobjects context, None if not a CPU one."""
+    import xobjects as xo
+
+    if isinstance(context, xo.ContextCpu):
+        return OPENMP_CONTEXT if context.openmp_enabled else SERIAL_CONTEXT
+    return None
 
-    raise PrebuiltKernelNotFoundError(
-        _build_no_suitable_kernel_message(
-            requested_context=requested_context,
-            diagnostics=diagnostics,
-            closest_rejection_reason=(
-                min(rejection_reasons)[1] if rejection_reasons else None
-            ),
-        )
-    )
+
+def _suitable_kernel_result(match):
+    """Return the result of `get_suitable_kernel` for a match of `_select_kernel`."""
+    module_name, tracker_element_classes, containing_dir, _ = match
+    return {
+        'module_name': module_name,
+        'tracker_element_classes': list(tracker_element_classes),
+        'containing_dir': containing_dir,
+    }
+
+
+def invalidate_kernel_cache():
+    """
+    Forget the cached kernel metadata and the memoized lookup results.
+
+    The caches are keyed on the modification time of the kernel directory, so
+    this is only needed when kernels are replaced in place. It is called by
+    `regenerate_kernels` and `clear_kernels`.
+    """
+    _KERNEL_CANDIDATES_CACHE.clear()
+    _SUITABLE_KERNEL_MEMO.clear()
 
 
 def regenerate_kernels(
@@ -237,11 +657,46 @@ def regenerate_kernels(
         location=PREBUILT_KERNELS_LOCATION,
         n_threads=None,
         context='serial',
+        incremental=False,
+        jobs_per_kernel=None,
+        start_method=None,
+        pgo=False,
 ):
     """
     Use the kernel definitions in the `kernel_definitions.py` file to
     regenerate kernel shared objects using the current version of xsuite.
+
+    With `incremental`, existing kernels are kept, and only the kernels whose
+    build hash (see `_kernel_build_hash`) changed are compiled again.
+
+    Each kernel can itself be compiled by `jobs_per_kernel` concurrent jobs
+    (see `_parallel_compilation_flags`). By default, the available CPUs are
+    shared between the kernels that are built at the same time.
+
+    Definitions can list instruction set variants under 'isa_variants' (see
+    `ISA_VARIANTS`); these are built in addition to the baseline kernel, when
+    the compiler supports them. Likewise, the flavors listed under 'flavors'
+    (see `KERNEL_FLAVORS`) are built in addition to the regular kernel, for
+    each instruction set variant.
+
+    With `pgo`, the kernels are built with profile-guided optimization: each
+    one is compiled with instrumentation, trained on the workload of
+    `xsuite.workloads`, and compiled again using the collected profile. These
+    kernels get the suffix `PGO_SUFFIX`, and are preferred at run time. Kernels
+    without tracker element classes, which the workload cannot exercise, and
+    compilers other than GCC get a regular build.
+
+    The kernels that took longest to compile last time are built first, so
+    that they do not end up alone at the tail of a parallel build. A summary
+    of the build is printed at the end.
+
+    Parallel builds use worker processes started with `start_method`. The
+    default, 'forkserver' where available, imports the Xsuite stack and the
+    kernel definitions once in the fork server, so that the workers start
+    without importing them again; 'spawn' starts every worker from scratch.
     """
+    from xsuite.kernel_definitions import BASE_CONFIG, kernel_definitions
+
     if kernels is not None and (
     isinstance(kernels, str) or not hasattr(kernels, '__iter__')):
         kernels = [kernels]
@@ -249,80 +704,335 @@ def regenerate_kernels(
     location = Path(location)
     context_keys = _context_keys_from_cli(context)
 
-    # Delete existing kernels to avoid accidentally loading in existing C code
-    clear_kernels(kernels=kernels, location=location, context=context)
+    # Read the statistics of the previous builds before they are cleared
+    build_history = _build_history(location)
+
+    if not incremental:
+        # Delete existing kernels to avoid accidentally loading in existing C code
+        clear_kernels(kernels=kernels, location=location, context=context)
+
+    if pgo and not _compiler_is_gcc():
+        _print('Profile-guided optimization needs GCC, building regular kernels.')
+        pgo = False
 
     kernels_to_build = []
     for base_module_name, metadata in kernel_definitions:
         if kernels is not None and base_module_name not in kernels:
             continue
+        kernel_pgo = pgo and bool(metadata['classes'])
+        isas = [None]
+        for isa in metadata.get('isa_variants', ()):
+            if _compiler_supports_isa(isa):
+                isas.append(isa)
+            else:
+                _print(f'Skipping the `{isa}` variant of `{base_module_name}`, '
+                       f'which the compiler cannot build here.')
+
+        flavors = [None, *metadata.get('flavors', ())]
+        for flavor in flavors[1:]:
+            if flavor not in KERNEL_FLAVORS:
+                raise ValueError(f'Unknown flavor `{flavor}` for `{base_module_name}`; '
+                                 f'expected one of {", ".join(KERNEL_FLAVORS)}.')
+
         for context_key in context_keys:
-            module_name = f'{base_module_name}{CONTEXT_SUFFIXES[context_key]}'
-            kernels_to_build.append(
-                (base_module_name, module_name, metadata, context_key))
+            for isa in isas:
+                for flavor in flavors:
+                    module_name = _kernel_module_name(
+                        base_module_name, context_key, isa, kernel_pgo, flavor)
+                    kernels_to_build.append((
+                        base_module_name, module_name, metadata, context_key,
+                        isa, kernel_pgo, flavor,
+                    ))
+
+    def expected_duration(item):
+        # Kernels never built before go first, they may well be long ones
+        duration = build_history.get(item[1], {}).get('duration_s')
+        return float('inf') if duration is None else duration
+
+    kernels_to_build.sort(key=expected_duration, reverse=True)
+
+    if jobs_per_kernel is None:
+        concurrent_builds = 1 if n_threads == 0 else (n_threads or _available_cpus())
+        concurrent_builds = min(concurrent_builds, len(kernels_to_build)) or 1
+        jobs_per_kernel = max(1, _available_cpus() // concurrent_builds)
 
     if n_threads == 0:
+        summaries = []
         for idx, item in enumerate(kernels_to_build):
-            base_module_name, module_name, metadata, context_key = item
-            build_single_kernel(
+            (base_module_name, module_name, metadata, context_key, isa,
+             kernel_pgo, flavor) = item
+            summaries.append(build_single_kernel(
                 idx, len(kernels_to_build), location, metadata, module_name,
-                base_module_name, context_key,
-            )
+                base_module_name, context_key, incremental, jobs_per_kernel,
+                build_history.get(module_name), isa, kernel_pgo, flavor,
+            ))
     else:
-        thread_pool = get_context('spawn').Pool(processes=n_threads)
+        # Forked from the fork server, a new worker per kernel is cheap, and
+        # the peak memory usage of its compiler processes is that of a single
+        # build. Spawned workers import the Xsuite stack, and are reused.
+        mp_context = _kernel_build_context(start_method)
+        fresh_workers = mp_context.get_start_method() == 'forkserver'
+        thread_pool = mp_context.Pool(
+            processes=n_threads, maxtasksperchild=1 if fresh_workers else None)
         results = []
         for idx, item in enumerate(kernels_to_build):
-            base_module_name, module_name, metadata, context_key = item
+            (base_module_name, module_name, metadata, context_key, isa,
+             kernel_pgo, flavor) = item
+            # The workers look the definition up by name: the metadata holds
+            # classes, which are slow to pickle and import
             args = (
-                idx, len(kernels_to_build), location, metadata, module_name,
-                base_module_name, context_key,
+                idx, len(kernels_to_build), location, base_module_name,
+                context_key, isa, flavor, kernel_pgo, incremental,
+                jobs_per_kernel, build_history.get(module_name), fresh_workers,
             )
-            result = thread_pool.apply_async(build_single_kernel, args=args)
+            result = thread_pool.apply_async(_build_kernel_task, args=args)
             results.append(result)
 
         thread_pool.close()
         thread_pool.join()
 
         # Ensure no errors
-        for result in results:
-            result.get()
+        summaries = [result.get() for result in results]
+
+    save_kernel_index(
+        location, [name for name, _ in kernel_definitions], BASE_CONFIG)
+    invalidate_kernel_cache()
+
+    _print(_format_build_summary(summaries))
+    n_built = sum(summary['status'] != 'up to date' for summary in summaries)
+    if incremental:
+        _print(f'Built {n_built} kernels, {len(summaries) - n_built} '
+               f'already up to date.')
+    else:
+        _print(f'Built {n_built} kernels.')
 
-    _print(f'Built {len(kernels_to_build)} kernels.')
+
+def _compile_with_profile(
+        compile_kernel, compiler_flags, module_name, location, context_key, config):
+    """
+    Compile a kernel with profile-guided optimization, and return the kernel
+    info together with a description of the training run.
+
+    The kernel is first compiled with instrumentation, and trained in a
+    separate interpreter (see `xsuite.workloads.train_kernel`), which writes
+    the profile when it exits. Both compilations run in the same working
+    directory, so that GCC finds the profile of the object file again.
+    """
+    with tempfile.TemporaryDirectory(prefix='xsuite_pgo_') as profile_dir:
+        instrumentation_flags = [
+            f'-fprofile-generate={profile_dir}',
+            # OpenMP threads update the counters concurrently
+            '-fprofile-update=atomic',
+        ]
+        with _extra_compiler_flags([*compiler_flags, *instrumentation_flags]):
+            kernel_info = compile_kernel(compile='force')
+
+        training_spec = {
+            'module_name': module_name,
+            'location': str(location),
+            'context': context_key,
+            'config': dict(config),
+            'tracker_element_classes': [
+                cls._DressingClass.__name__
+                for cls in kernel_info['tracker_element_classes']
+            ],
+        }
+        _print(f'Training `{module_name}`...')
+        training = subprocess.run(
+            [sys.executable, '-m', 'xsuite.workloads', json.dumps(training_spec)],
+            capture_output=True, text=True,
+        )
+        if training.returncode != 0:
+            raise RuntimeError(
+                f'The training run of `{module_name}` failed:\n{training.stderr}')
+        pgo_info = json.loads(training.stdout.strip().splitlines()[-1])
+
+        optimization_flags = [
+            f'-fprofile-use={profile_dir}',
+            # Counters updated concurrently may be slightly inconsistent
+            '-fprofile-correction',
+            '-Wno-missing-profile',
+        ]
+        with _extra_compiler_flags([*compiler_flags, *optimization_flags]):
+            kernel_info = compile_kernel(compile='force')
+
+    return kernel_info, pgo_info
+
+
+def _pgo_workload_version():
+    from xsuite.workloads import TRAINING_WORKLOAD_VERSION
+    return TRAINING_WORKLOAD_VERSION
+
+
+def _kernel_build_context(start_method=None):
+    """
+    Return the multiprocessing context for the kernel build workers. With
+    'forkserver', the fork server preloads the kernel definitions, and with
+    them Xobjects, Xtrack, Xfields and Xcoll.
+    """
+    if start_method is None:
+        if 'forkserver' in get_all_start_methods():
+            start_method = 'forkserver'
+        else:
+            start_method = 'spawn'
+
+    mp_context = get_context(start_method)
+    if start_method == 'forkserver':
+        mp_context.set_forkserver_preload(['xsuite.kernel_definitions'])
+    return mp_context
+
+
+def _build_kernel_task(
+        idx, total, location, base_module_name, context_key, isa, flavor, pgo,
+        incremental, jobs_per_kernel, previous_build, measure_peak_rss,
+):
+    """Build the kernel `base_module_name` in a worker of `regenerate_kernels`."""
+    from xsuite.kernel_definitions import kernel_definitions
+
+    metadata = dict(kernel_definitions)[base_module_name]
+    module_name = _kernel_module_name(base_module_name, context_key, isa, pgo, flavor)
+    return build_single_kernel(
+        idx, total, location, metadata, module_name, base_module_name,
+        context_key, incremental, jobs_per_kernel, previous_build, isa, pgo,
+        flavor, measure_peak_rss=measure_peak_rss,
+    )
 
 
 def build_single_kernel(
         idx, total, location, metadata, module_name, base_module_name, context_key,
+        incremental=False, jobs_per_kernel=1, previous_build=None, isa=None,
+        pgo=False, flavor=None, custom=False, measure_peak_rss=False,
 ):
-    """Build one configured kernel module and save its matching metadata."""
-    _print(f'[{idx + 1}/{total}] Building `{module_name}`...')
+    """
+    Build one configured kernel module and save its matching metadata.
+
+    With `incremental`, the compilation is skipped when the existing kernel
+    was built from the same inputs. When the shared object cache is enabled
+    (see `xsuite.object_cache`), a binary built from the same inputs is taken
+    from there instead of compiling it. The compilation is split into
+    `jobs_per_kernel` concurrent jobs where the compiler supports it, and
+    targets the instruction set variant `isa` (see `ISA_VARIANTS`) if given.
+    With `pgo`, the kernel is built with profile-guided optimization (see
+    `_compile_with_profile`), and with `flavor` it gets the compiler flags of
+    that flavor (see `KERNEL_FLAVORS`). `custom` is recorded in the metadata
+    of kernels that do not come from `kernel_definitions`. The kernels of the
+    definitions with `runtime_config` take the numeric config values of
+    `RUNTIME_CONFIG_KEYS` at run time rather than compiling them in (see
+    `xsuite.runtime_config`).
+
+    The duration of the compilation is saved in the metadata, and with
+    `measure_peak_rss` its peak memory usage too (see `_children_peak_rss`),
+    except for `pgo` builds, which also run the training workload. A kernel
+    taken from the object cache keeps the statistics of its `previous_build`.
+    Return a summary of the build for `_format_build_summary`.
+    """
+    import xobjects as xo
+    import xtrack as xt
+
+    from xsuite import instrumentation, object_cache, runtime_config
 
     config = metadata['config']
     tracker_element_classes = metadata['classes']
-    extra_classes = metadata.get('extra_classes', [])
+    extra_classes = list(metadata.get('extra_classes', []))
     build_context = xo.ContextCpu() if context_key == SERIAL_CONTEXT else xo.ContextCpu(
         omp_num_threads='auto'
     )
 
-    with warnings.catch_warnings():
-        # We still include deprecated elements in the kernels, so silence the warnings
-        warnings.filterwarnings('ignore', category=FutureWarning)
+    tracker_config = xt.tracker.TrackerConfig()
+    tracker_config.update(config)
+
+    runtime_keys = []
+    if metadata.get('runtime_config'):
+        runtime_keys = runtime_config.runtime_config_keys(tracker_config)
+    extra_headers = []
+    if runtime_keys:
+        extra_headers = runtime_config.runtime_config_headers(tracker_config)
+        extra_classes.append(runtime_config.kernel_runtime_config_class())
+
+    def compile_kernel(compile):
+        with warnings.catch_warnings():
+            # We still include deprecated elements in the kernels, so silence the warnings
+            warnings.filterwarnings('ignore', category=FutureWarning)
+
+            return xt.Tracker._compile_kernel_from_classes(
+                context=build_context,
+                config=tracker_config,
+                tracker_element_classes=[
+                    *tracker_element_classes,
+                    xt.ParticlesMonitor,
+                    xt.MultiElementMonitor,
+                ],
+                extra_classes=extra_classes,
+                extra_headers=extra_headers,
+                module_name=module_name,
+                containing_dir=location,
+                compile=compile,
+            )
+
+    start_time = time.perf_counter()
+    metadata_file = Path(location) / f'{module_name}.json'
+    binary_file = _kernel_binary_file(module_name, location)
+    if binary_file.is_symlink():
+        # Linked from another kernel directory, never build through it
+        binary_file.unlink()
+    build_stats = previous_build
+    pgo_info = None
+    if pgo:
+        # Kept for a kernel taken from the object cache
+        pgo_info = (_existing_metadata(metadata_file).get('pgo')
+                    or {'workload_version': _pgo_workload_version()})
+    from_object_cache = False
+    if incremental or object_cache.object_cache_location() is not None:
+        # Generating the source is quick compared to compiling it
+        kernel_info = compile_kernel(compile=False)
+        build_hash = _kernel_build_hash(
+            kernel_info['kernel'].specialized_source, module_name,
+            context_key, tracker_config, isa, pgo, flavor, jobs_per_kernel,
+        )
+        existing_metadata = _existing_metadata(metadata_file)
+        if (incremental and existing_metadata.get('build_hash') == build_hash
+                and binary_file.exists()):
+            _print(f'[{idx + 1}/{total}] `{module_name}` is up to date.')
+            return _build_summary(
+                module_name, 'up to date', start_time, binary_file,
+                len(existing_metadata.get('classes', ())),
+            )
 
-        tracker_config = xt.tracker.TrackerConfig()
-        tracker_config.update(config)
+        # Never leave metadata that describes a binary being rebuilt
+        metadata_file.unlink(missing_ok=True)
+        from_object_cache = object_cache.fetch(build_hash, binary_file)
 
-        kernel_info = xt.Tracker._compile_kernel_from_classes(
-            context=build_context,
-            config=tracker_config,
-            tracker_element_classes=[
-                *tracker_element_classes,
-                xt.ParticlesMonitor,
-                xt.MultiElementMonitor,
-            ],
-            extra_classes=extra_classes,
-            module_name=module_name,
-            containing_dir=location,
-            compile='force',
+    if from_object_cache:
+        _print(f'[{idx + 1}/{total}] Took `{module_name}` from the object cache.')
+    else:
+        _print(f'[{idx + 1}/{total}] Building `{module_name}`...')
+        compile_start_time = time.perf_counter()
+        compiler_flags = [*KERNEL_COMPILER_FLAGS,
+                          *_parallel_compilation_flags(jobs_per_kernel)]
+        if isa is not None:
+            compiler_flags += ISA_VARIANTS[isa].compiler_flags
+        if flavor is not None:
+            compiler_flags += KERNEL_FLAVORS[flavor]
+        with instrumentation.timed('compile', module_name=module_name):
+            if pgo:
+                kernel_info, pgo_info = _compile_with_profile(
+                    compile_kernel, compiler_flags, module_name, location,
+                    context_key, tracker_config,
+                )
+            else:
+                with _extra_compiler_flags(compiler_flags):
+                    kernel_info = compile_kernel(compile='force')
+        build_stats = {
+            'duration_s': round(time.perf_counter() - compile_start_time, 3),
+            'peak_rss_bytes': (_children_peak_rss() if measure_peak_rss and not pgo
+                               else None),
+            'jobs': jobs_per_kernel,
+        }
+        build_hash = _kernel_build_hash(
+            kernel_info['kernel'].specialized_source, module_name,
+            context_key, tracker_config, isa, pgo, flavor, jobs_per_kernel,
         )
+        object_cache.store(build_hash, binary_file)
 
     save_kernel_metadata(
         module_name=module_name,
@@ -332,7 +1042,94 @@ def build_single_kernel(
         tracker_element_classes=kernel_info['tracker_element_classes'],
         all_classes=kernel_info['all_classes'],
         location=location,
+        build_hash=build_hash,
+        build_stats=build_stats,
+        isa=isa,
+        pgo=pgo_info,
+        flavor=flavor,
+        custom=custom,
+        runtime_config=runtime_keys,
     )
+    return _build_summary(
+        module_name, 'cached' if from_object_cache else 'built', start_time,
+        binary_file, len(kernel_info['all_classes']),
+    )
+
+
+def build_kernel_from_line(
+        line,
+        context='serial',
+        location=PREBUILT_KERNELS_LOCATION,
+        incremental=True,
+        jobs_per_kernel=None,
+):
+    """
+    Build a custom kernel with only the element classes and the tracker config
+    of `line`, an `xtrack.Line` or the path of a line saved as JSON, and
+    return the names of the modules built (one per context).
+
+    The kernel is named after a hash of its classes and config (see
+    `CUSTOM_KERNEL_PREFIX`), so building it again for a line with the same
+    classes and config reuses it when `incremental` is set. Custom kernels are
+    preferred by `get_suitable_kernel` over the much larger default kernels.
+    """
+    import xtrack as xt
+
+    from xsuite.kernel_definitions import NAME_CLASS_MAP
+
+    if not isinstance(line, xt.Line):
+        line = xt.Line.from_json(line)
+    if not line._has_valid_tracker():
+        line.build_tracker(compile=False)
+
+    element_classes = sorted(
+        {cls._DressingClass for cls in line.tracker.line_element_classes},
+        key=lambda cls: cls.__name__,
+    )
+    unknown_classes = [cls.__name__ for cls in element_classes
+                       if NAME_CLASS_MAP.get(cls.__name__) is not cls]
+    if unknown_classes:
+        raise ValueError(
+            f'Cannot build a prebuilt kernel for the element classes '
+            f'{", ".join(unknown_classes)}, which are not part of the Xsuite '
+            f'kernel definitions.')
+
+    config = dict(line.config)
+    definition = {
+        'config': config,
+        'classes': element_classes,
+        'extra_classes': [xt.Particles],
+    }
+    base_module_name = _custom_kernel_name(
+        [cls.__name__ for cls in element_classes], config)
+
+    location = Path(location)
+    location.mkdir(parents=True, exist_ok=True)
+    if jobs_per_kernel is None:
+        jobs_per_kernel = _available_cpus()
+
+    context_keys = _context_keys_from_cli(context)
+    module_names = []
+    for idx, context_key in enumerate(context_keys):
+        module_name = _kernel_module_name(base_module_name, context_key)
+        summary = build_single_kernel(
+            idx, len(context_keys), location, definition, module_name,
+            base_module_name, context_key, incremental=incremental,
+            jobs_per_kernel=jobs_per_kernel, custom=True,
+        )
+        _print(_format_build_summary([summary]))
+        module_names.append(module_name)
+
+    save_kernel_index(location)
+    invalidate_kernel_cache()
+    return module_names
+
+
+def _custom_kernel_name(class_names, config):
+    config = _normalize_config(config)
+    key = json.dumps(
+        [sorted(class_names), sorted((k, repr(v)) for k, v in config.items())])
+    return CUSTOM_KERNEL_PREFIX + hashlib.sha256(key.encode()).hexdigest()[:12]
 
 
 def clear_kernels(
@@ -367,9 +1164,218 @@ def clear_kernels(
         if verbose:
             _print(f'Removed `{file}`.')
 
+    save_kernel_index(location)
+    invalidate_kernel_cache()
+
+
+def _kernel_build_hash(
+        source, module_name, context_key, config, isa=None, pgo=False, flavor=None,
+        jobs_per_kernel=1):
+    """
+    Hash all the inputs that determine a compiled kernel: the generated C
+    source, the compiler and its flags, the tracker config, the package
+    versions (which also pin the included headers), and the Python ABI.
+    Link-time optimization, used to compile with several `jobs_per_kernel`,
+    changes the generated code, but the number of jobs does not.
+
+    The source is hashed as it is, except for the order of the C code of the
+    Xobjects classes, which varies between processes (see `_source_digest`).
+    """
+    build_inputs = {
+        'source': _source_digest(source),
+        'module_name': module_name,
+        'context': context_key,
+        'kernel_flags': list(KERNEL_COMPILER_FLAGS),
+        'lto': bool(_parallel_compilation_flags(jobs_per_kernel)),
+        'isa_flags': ISA_VARIANTS[isa].compiler_flags if isa is not None else None,
+        'pgo_workload': _pgo_workload_version() if pgo else None,
+        'flavor_flags': KERNEL_FLAVORS[flavor] if flavor is not None else None,
+        'config': sorted((key, repr(value)) for key, value in dict(config).items()),
+        'versions': _current_package_versions(),
+        'compiler': _compiler_fingerprint(),
+    }
+    serialized = json.dumps(build_inputs, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _source_digest(source):
+    """
+    Return a digest of a generated kernel source that does not depend on the
+    order of the blocks of C code of the Xobjects classes in it.
+
+    Xobjects collects the classes of a kernel in a set, and only sorts them
+    by their dependencies, so the other classes come in an order that varies
+    between processes. The code of each class starts with the guard
+    `#ifndef XOBJ_TYPEDEF_<class>`; the blocks that start there, up to the
+    next one, are hashed in sorted order. The code before the first block,
+    and within each block (the last one holding the kernel functions), is
+    hashed as it is.
+    """
+    blocks = ['']
+    for line in source.splitlines(keepends=True):
+        if line.startswith('#ifndef XOBJ_TYPEDEF_'):
+            blocks.append('')
+        blocks[-1] += line
+    preamble, class_blocks = blocks[0], blocks[1:]
+    digests = [hashlib.sha256(preamble.encode()).hexdigest()]
+    digests += sorted(hashlib.sha256(block.encode()).hexdigest() for block in class_blocks)
+    return hashlib.sha256('\n'.join(digests).encode()).hexdigest()
+
+
+def _compiler_fingerprint():
+    """Return the compiler settings that CFFI builds extension modules with."""
+    fingerprint = {
+        name: sysconfig.get_config_var(name)
+        for name in ('CC', 'CFLAGS', 'CCSHARED', 'LDSHARED', 'EXT_SUFFIX')
+    }
+    # Environment variables that distutils applies on top of the above
+    for name in ('CC', 'CFLAGS', 'CPPFLAGS', 'LDSHARED', 'LDFLAGS'):
+        fingerprint[f'env:{name}'] = os.environ.get(name)
+    return fingerprint
+
+
+def _parallel_compilation_flags(n_jobs):
+    """
+    Return the compiler flags that split the compilation of one kernel into
+    `n_jobs` concurrent jobs, or no flags if that is not possible.
+
+    Xobjects generates each kernel as a single C file, in which the element
+    tracking functions are `static`, so it cannot be split into several
+    translation units. Instead, GCC's link-time optimization partitions the
+    file after parsing, and optimizes and generates code for the partitions
+    in parallel, before linking them into one extension module. This changes
+    the inlining and code generation, so whether it is used is part of the
+    build hash. The number of jobs only sets how many partitions are compiled
+    at once, not how the file is partitioned, and is left out of the hash.
+    Code generation, rather than parsing the headers, takes most of the time.
+    """
+    if not n_jobs or n_jobs < 2 or not _compiler_is_gcc():
+        return []
+    return [f'-flto={n_jobs}', '-flto-partition=balanced']
+
+
+@lru_cache(maxsize=None)
+def _compiler_is_gcc():
+    """Whether CFFI compiles with GCC (as opposed to e.g. Clang on macOS)."""
+    compiler = (os.environ.get('CC') or sysconfig.get_config_var('CC') or 'cc').split()
+    try:
+        version = subprocess.run(
+            [compiler[0], '--version'], capture_output=True, text=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return 'Free Software Foundation' in version and 'clang' not in version
+
+
+@contextmanager
+def _extra_compiler_flags(flags):
+    """
+    Temporarily append `flags` to the CFLAGS environment variable, which
+    distutils (used by CFFI) passes both to the compiler and to the linker.
+    Recent versions of distutils use the variable instead of the flags Python
+    was built with (e.g. `-DNDEBUG -fwrapv`), rather than in addition to
+    them, so these are kept when it is not set.
+    """
+    if not flags:
+        yield
+        return
+
+    previous = os.environ.get('CFLAGS')
+    base = previous if previous is not None else sysconfig.get_config_var('CFLAGS')
+    os.environ['CFLAGS'] = ' '.join([base, *flags] if base else flags)
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ['CFLAGS']
+        else:
+            os.environ['CFLAGS'] = previous
+
+
+def _available_cpus():
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _existing_metadata(metadata_file):
+    """Return the content of a kernel metadata file, or {} if unreadable."""
+    try:
+        with Path(metadata_file).open('r') as fd:
+            metadata = json.load(fd)
+    except (OSError, ValueError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _build_history(location):
+    """Map module names to the build statistics of the kernels in `location`."""
+    history = {}
+    for metadata_file in _iter_kernel_metadata_files(location):
+        build_stats = _existing_metadata(metadata_file).get('build')
+        if isinstance(build_stats, dict):
+            history[metadata_file.stem] = build_stats
+    return history
+
+
+def _children_peak_rss():
+    """
+    Return the peak resident memory, in bytes, of the largest terminated
+    child process (the compiler, including the processes it spawned), or None
+    where this is not measurable. This covers all the children of the process
+    so far, so it is only that of one build in a process that built nothing
+    else, such as a new worker of `regenerate_kernels`.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Reported in kilobytes on Linux, but in bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _build_summary(module_name, status, start_time, binary_file, n_classes):
+    try:
+        size = Path(binary_file).stat().st_size
+    except OSError:
+        size = None
+    return {
+        'module_name': module_name,
+        'status': status,
+        'wall_time_s': time.perf_counter() - start_time,
+        'size_bytes': size,
+        'n_classes': n_classes,
+    }
+
+
+def _format_build_summary(summaries):
+    """Format the summaries returned by `build_single_kernel` as a table."""
+    name_width = max([len('Kernel')] + [len(s['module_name']) for s in summaries])
+    lines = [
+        f'{"Kernel":<{name_width}}  {"Status":<10}  {"Wall time":>10}  '
+        f'{"Size":>10}  {"Classes":>7}'
+    ]
+    for summary in summaries:
+        size = summary['size_bytes']
+        size = '-' if size is None else f'{size / 1024 ** 2:.1f} MiB'
+        lines.append(
+            f'{summary["module_name"]:<{name_width}}  {summary["status"]:<10}  '
+            f'{summary["wall_time_s"]:>8.1f} s  {size:>10}  '
+            f'{summary["n_classes"]:>7}'
+        )
+    return '\n'.join(lines)
+
 
 def _current_package_versions():
     """Return the package versions that prebuilt kernels are tied to."""
+    import xcoll as xc
+    import xfields as xf
+    import xobjects as xo
+    import xtrack as xt
+
     return {
         'xtrack': xt.__version__,
         'xfields': xf.__version__,
@@ -378,14 +1384,289 @@ def _current_package_versions():
     }
 
 
-def _find_kernel_candidates(verbose=False):
+def _select_kernel(
+        candidates,
+        config,
+        frozen_config,
+        requested_tracker_class_names,
+        requested_class_names,
+        requested_context,
+        requested_flavor=None,
+        verbose=False,
+        optional_flags=(),
+):
+    """
+    Return the cheapest candidate that can serve the request (see
+    `_kernel_costs`), as a tuple of the module name, its tracker element
+    classes, its directory and the built-in values of the config keys it takes
+    at run time, together
+    with the reason for rejecting the closest unsuitable candidate and the
+    category of that reason ('context', 'config' or 'classes'), both None if
+    there is none.
+
+    The config keys that a candidate takes at run time only need to be present
+    in the request, with a numeric value, unless the kernel is already in use
+    with other values in this process (see `xsuite.runtime_config`); the
+    kernels with these values compiled in are cheaper. The
+    `optional_flags` of the request may be absent from the candidate config.
+
+    The checks only compare strings, hashes and class bitmasks. The rejection
+    reasons are ranked (context mismatch worst, then config differences, then
+    missing classes, fewer differences being closer), and only formatted
+    when they are the closest so far.
+    """
+    from xsuite import runtime_config
+    from xsuite.kernel_definitions import NAME_CLASS_MAP
+
+    # The request frozen with the runtime values of each set of runtime keys
+    frozen_configs = {(): frozen_config}
+    requested_tracker_class_mask = _class_name_mask(requested_tracker_class_names)
+    requested_class_mask = _class_name_mask(requested_class_names)
+
+    closest_key, closest_reason = None, None
+    suitable = []
+    for candidate in candidates:
+        module_name = candidate.module_name
+        if verbose:
+            _print(
+                f"==> Considering the precompiled kernel `{module_name}`...")
+
+        if candidate.flavor is not None and candidate.flavor != requested_flavor:
+            # Never a reason for not finding a kernel, the regular one follows
+            if verbose:
+                _print(
+                    f'The kernel `{module_name}` is skipped. Its flavor '
+                    f'`{candidate.flavor}` was not requested.')
+            continue
+
+        kernel_context = candidate.context
+        if requested_context is not None and kernel_context != requested_context:
+            key = (3000, module_name)
+            if closest_key is None or key < closest_key:
+                closest_key, closest_reason = key, (
+                    f'`{module_name}` was built for context `{kernel_context}`, '
+                    f'but context `{requested_context}` was requested.'
+                )
+            if verbose:
+                _print(
+                    f'The kernel `{module_name}` is unsuitable. Its context '
+                    f'is `{kernel_context}`, but the requested one is '
+                    f'`{requested_context}`.')
+            continue
+
+        runtime_keys = candidate.runtime_keys
+        if runtime_keys not in frozen_configs:
+            frozen_configs[runtime_keys] = (
+                None if frozen_config is None
+                else _freeze_config(config, runtime_keys))
+        requested_config = frozen_configs[runtime_keys]
+
+        if requested_config is None or candidate.config is None:
+            # Unhashable config values, fall back to comparing the dicts
+            lhs = _normalize_config(candidate.metadata['config'], runtime_keys)
+            rhs = _normalize_config(config, runtime_keys)
+            diff_keys = {kk for kk in set(lhs.keys()) | set(rhs.keys())
+                         if lhs.get(kk) != rhs.get(kk)}
+        elif candidate.config != requested_config:
+            diff_keys = {kk for kk, _ in candidate.config ^ requested_config}
+        else:
+            diff_keys = None
+
+        if diff_keys and optional_flags:
+            candidate_keys = _normalize_config(candidate.metadata['config']).keys()
+            diff_keys = {kk for kk in diff_keys
+                         if kk not in optional_flags or kk in candidate_keys} or None
+
+        if diff_keys is not None:
+            key = (2000 + len(diff_keys), module_name)
+            if closest_key is None or key < closest_key:
+                closest_key, closest_reason = key, (
+                    f'`{module_name}` has a different configuration '
+                    f'({len(diff_keys)} differing key(s): '
+                    f'{", ".join(sorted(diff_keys)) or "none"}).'
+                )
+            if verbose:
+                lhs, rhs = candidate.metadata['config'], config
+                config_diff = {kk: (lhs.get(kk), rhs.get(kk)) for kk in diff_keys}
+                _print(
+                    f'The kernel `{module_name}` is unsuitable. Its config '
+                    f'(left) and the requested one (right) differ at the '
+                    f'following keys:\n'
+                    f'{pformat(config_diff)}')
+                _print(
+                    f'Skipping class compatibility check for `{module_name}`.')
+
+            continue
+
+        if runtime_keys and not runtime_config.can_bind(
+                _kernel_binary_file(module_name, candidate.location),
+                _runtime_values(config, runtime_keys)):
+            key = (2000 + len(runtime_keys), module_name)
+            if closest_key is None or key < closest_key:
+                closest_key, closest_reason = key, (
+                    f'`{module_name}` is already in use with other values of '
+                    f'{", ".join(runtime_keys)}.'
+                )
+            if verbose:
+                _print(
+                    f'The kernel `{module_name}` is unsuitable. It is already '
+                    f'in use with other values of {", ".join(runtime_keys)}.')
+            continue
+
+        if verbose:
+            _print(f'The kernel `{module_name}` has the right config.')
+
+        missing_tracker_classes = requested_tracker_class_mask & ~candidate.tracker_class_mask
+        missing_classes = requested_class_mask & ~candidate.class_mask
+        if missing_tracker_classes or missing_classes:
+            if missing_tracker_classes:
+                missing_mask = missing_tracker_classes
+                description = 'requested tracker element class(es)'
+            else:
+                missing_mask = missing_classes
+                description = 'requested class(es)'
+
+            key = (1000 + missing_mask.bit_count(), module_name)
+            if closest_key is None or key < closest_key:
+                class_diff = _class_names_from_mask(missing_mask)
+                closest_key, closest_reason = key, (
+                    f'`{module_name}` is missing {description}: '
+                    f'{", ".join(sorted(class_diff))}.'
+                )
+            if verbose:
+                _print(
+                    f'The kernel `{module_name}` is unsuitable. It does not '
+                    f'provide the following requested classes: '
+                    f'{", ".join(_class_names_from_mask(missing_mask))}.')
+            continue
+
+        if verbose:
+            _print(f'The kernel `{module_name}` is suitable.')
+        suitable.append(candidate)
+
+    if not suitable:
+        if verbose:
+            _print('==> No suitable precompiled kernel found.')
+        return None, closest_reason, _rejection_category(closest_key)
+
+    costs = _kernel_costs(suitable)
+    candidate = min(suitable, key=lambda candidate: costs[candidate.module_name])
+    module_name = candidate.module_name
+
+    tracker_element_classes = []
+    for ccnn in candidate.metadata['tracker_element_classes']:
+        cc = NAME_CLASS_MAP.get(ccnn, None)
+        if cc is None:
+            raise ValueError(f'Class `{ccnn}` from kernel `{module_name}` is not available in the current version of xsuite.')
+        tracker_element_classes.append(cc)
+    if verbose:
+        if len(suitable) > 1:
+            _print('Costs of the suitable kernels:\n' + pformat(costs))
+        _print(f'Found suitable prebuilt kernel `{module_name}`.')
+    match = (module_name, tuple(tracker_element_classes), candidate.location,
+             _runtime_values(candidate.metadata['config'], candidate.runtime_keys))
+    return (match, closest_reason, _rejection_category(closest_key))
+
+
+def _kernel_costs(candidates):
+    """
+    Return a sortable cost for each of the suitable `candidates`, by module
+    name; the cheapest one is used.
+
+    The requested flavor is preferred in any case, then the kernels with the
+    requested config compiled in over the ones taking some of it at run time
+    (see `xsuite.runtime_config`). Then, if every candidate
+    has throughput measurements (see `xsuite.bench.record_benchmarks`) on a
+    common benchmark line, the fastest kernel on those lines is the cheapest.
+    Otherwise the kernel with the fewest classes is, as its element dispatch
+    and its binary, which is loaded in every process, are the smallest. Ties
+    are broken by the preferred instruction set variant and profile-guided
+    builds, the size of the binary, and finally the order of
+    `kernel_definitions`.
     """
-    Scan the cache once and return usable candidates plus skip diagnostics.
+    measurements = [candidate.metadata.get('benchmark', {}) for candidate in candidates]
+    common_lines = set(measurements[0]).intersection(*measurements[1:])
+
+    costs = {}
+    for candidate, measurement in zip(candidates, measurements):
+        if common_lines:
+            # Geometric mean of the throughputs in particle-turns per second
+            log_throughput = sum(
+                math.log(measurement[line]) for line in common_lines) / len(common_lines)
+            main_cost = -round(math.exp(log_throughput))
+        else:
+            main_cost = candidate.class_mask.bit_count()
+        try:
+            binary_size = _kernel_binary_file(
+                candidate.module_name, candidate.location).stat().st_size
+        except OSError:
+            binary_size = None
+        costs[candidate.module_name] = (
+            candidate.flavor_rank,
+            bool(candidate.runtime_keys),
+            main_cost,
+            candidate.isa_rank,
+            candidate.pgo_rank,
+            binary_size if binary_size is not None else float('inf'),
+            candidate.priority,
+            candidate.context_rank,
+            candidate.module_name,
+        )
+    return costs
+
+
+def _rejection_category(rejection_key):
+    if rejection_key is None:
+        return None
+    return {3: 'context', 2: 'config', 1: 'classes'}[rejection_key[0] // 1000]
+
+
+def _miss_reason(closest_category, diagnostics):
+    """Categorize a failed lookup for `xsuite.kernel_stats()`."""
+    if closest_category is not None:
+        return closest_category
+    if diagnostics['version_mismatches']:
+        return 'version'
+    if diagnostics['missing_binary_details']:
+        return 'missing_binary'
+    return 'no_kernel'
+
+
+def _find_kernel_candidates(verbose=False, locations=None):
+    """
+    Scan the kernel directories `locations` (by default only
+    `PREBUILT_KERNELS_LOCATION`) once and return usable candidates plus skip
+    diagnostics.
 
     Candidates are compatible with the current xsuite package versions and
-    have a compiled binary for the current Python ABI. Diagnostics explain
-    metadata files skipped before config/class matching.
+    have a compiled binary for the current Python ABI, and are sorted in the
+    order in which they should be tried. Diagnostics explain metadata files
+    skipped before config/class matching. The result is cached until the
+    kernel directory changes; a verbose call always rescans, so that the
+    diagnostics are printed.
     """
+    from xsuite import instrumentation
+
+    if locations is None:
+        locations = (PREBUILT_KERNELS_LOCATION,)
+
+    cache_key = _kernel_cache_key(locations)
+    if not verbose and cache_key in _KERNEL_CANDIDATES_CACHE:
+        return _KERNEL_CANDIDATES_CACHE[cache_key]
+
+    with instrumentation.timed('scan'):
+        candidates, diagnostics = _scan_kernel_candidates(verbose, locations)
+
+    # Only the bundled directory and the full search path are usually looked up
+    if len(_KERNEL_CANDIDATES_CACHE) >= 2:
+        _KERNEL_CANDIDATES_CACHE.clear()
+    _KERNEL_CANDIDATES_CACHE[cache_key] = candidates, diagnostics
+    return candidates, diagnostics
+
+
+def _scan_kernel_candidates(verbose, locations):
+    from xsuite.kernel_definitions import kernel_definitions
+
     diagnostics = {
         'metadata_file_count': 0,
         'known_metadata_count': 0,
@@ -397,37 +1678,42 @@ def _find_kernel_candidates(verbose=False):
 
     kernel_order = {name: idx for idx, (name, _) in enumerate(kernel_definitions)}
     candidates = []
-    for metadata_file in _iter_kernel_metadata_files():
+    seen_module_names = set()
+    for location, metadata_file_name, file_names, entry in _iter_search_path_metadata(
+            locations):
         diagnostics['metadata_file_count'] += 1
 
-        try:
-            module_name, kernel_metadata, explicit_context = _read_kernel_metadata(
-                metadata_file
-            )
-        except Exception as err:
+        if isinstance(entry, Exception):
             diagnostics['unknown_metadata'].append(
-                f'`{metadata_file.name}` could not be read ({err}).'
+                f'`{metadata_file_name}` could not be read ({entry}).'
             )
             continue
 
+        module_name, kernel_metadata, explicit_context = entry
+        if module_name in seen_module_names:
+            # Shadowed by the kernel of the same name earlier in the path
+            continue
+
         base_module_name = kernel_metadata['base_module_name']
+        custom = kernel_metadata.get('custom', False)
 
-        if base_module_name not in kernel_order:
+        if base_module_name not in kernel_order and not custom:
             diagnostics['unknown_metadata'].append(
                 f'`{module_name}` is not a known kernel for this xsuite '
                 f'version.'
             )
             continue
 
-        if not _kernel_binary_file(module_name).exists():
+        binary_file_name = _kernel_binary_file(module_name).name
+        if binary_file_name not in file_names:
             diagnostics['missing_binary_details'].append(
                 f'`{module_name}` metadata exists, but '
-                f'`{_kernel_binary_file(module_name).name}` was not found.'
+                f'`{binary_file_name}` was not found.'
             )
             if verbose:
                 _print(
-                    f'Compiled kernel `{_kernel_binary_file(module_name).name}` '
-                    f'not found for metadata `{metadata_file.name}`.'
+                    f'Compiled kernel `{binary_file_name}` '
+                    f'not found for metadata `{metadata_file_name}`.'
                 )
             continue
 
@@ -453,17 +1739,323 @@ def _find_kernel_candidates(verbose=False):
         if version_mismatch:
             continue
 
+        isa = kernel_metadata.get('isa')
+        if isa is not None and isa not in ISA_VARIANTS:
+            diagnostics['unknown_metadata'].append(
+                f'`{module_name}` targets the unknown instruction set `{isa}`.'
+            )
+            continue
+        if isa is not None and not _cpu_supports_isa(isa):
+            if verbose:
+                _print(
+                    f'The kernel `{module_name}` targets the instruction set '
+                    f'`{isa}`, which this CPU does not support.'
+                )
+            continue
+
+        flavor = kernel_metadata.get('flavor')
+        if flavor is not None and flavor not in KERNEL_FLAVORS:
+            diagnostics['unknown_metadata'].append(
+                f'`{module_name}` has the unknown flavor `{flavor}`.'
+            )
+            continue
+
         diagnostics['compatible_metadata_count'] += 1
-        candidates.append((
-            kernel_order[base_module_name],
-            0 if explicit_context else 1,
-            module_name,
-            kernel_metadata,
+        seen_module_names.add(module_name)
+        tracker_class_names = kernel_metadata['tracker_element_classes']
+        runtime_keys = tuple(kernel_metadata.get('runtime_config', ()))
+        if custom:
+            priority = _CUSTOM_KERNEL_PRIORITY + len(tracker_class_names)
+        else:
+            priority = kernel_order[base_module_name]
+        candidates.append(_KernelCandidate(
+            priority=priority,
+            context_rank=0 if explicit_context else 1,
+            flavor_rank=0 if flavor is not None else 1,
+            isa_rank=-_isa_level(isa),
+            pgo_rank=0 if 'pgo' in kernel_metadata else 1,
+            module_name=module_name,
+            metadata=kernel_metadata,
+            context=kernel_metadata['context'],
+            config=_freeze_config(kernel_metadata['config'], runtime_keys),
+            tracker_class_mask=_class_name_mask(tracker_class_names),
+            class_mask=_class_name_mask(
+                [*tracker_class_names, *kernel_metadata['classes']]),
+            flavor=flavor,
+            location=location,
+            runtime_keys=runtime_keys,
         ))
 
+    candidates.sort()
     return candidates, diagnostics
 
 
+def _iter_search_path_metadata(locations):
+    """
+    Yield the location, metadata file name, directory listing and metadata
+    entry (see `_load_kernel_metadata`) of every kernel in `locations`.
+    """
+    for location in locations:
+        file_names = _list_kernel_directory(location)
+        for metadata_file_name, entry in _load_kernel_metadata(location, file_names):
+            yield location, metadata_file_name, file_names, entry
+
+
+def _kernel_cache_key(locations=None):
+    """
+    Return a key identifying the current state of the kernel directories
+    `locations`, by default only `PREBUILT_KERNELS_LOCATION`.
+
+    Adding or removing files updates the modification time of a directory,
+    and the package versions decide which metadata is compatible.
+    """
+    if locations is None:
+        locations = (PREBUILT_KERNELS_LOCATION,)
+
+    directory_states = []
+    for location in locations:
+        try:
+            directory_mtime = Path(location).stat().st_mtime_ns
+        except OSError:
+            directory_mtime = None
+        directory_states.append((str(location), directory_mtime))
+    return (
+        tuple(directory_states),
+        tuple(sorted(_current_package_versions().items())),
+    )
+
+
+def kernel_search_path() -> Tuple[Path, ...]:
+    """
+    Return the directories in which kernels are looked up, in order of
+    precedence: the entries of `XSUITE_KERNEL_PATH`, the user kernel cache
+    (see `user_kernel_cache_location`) and `PREBUILT_KERNELS_LOCATION`. A
+    kernel shadows the kernels of the same name further down the path.
+    """
+    locations = [
+        Path(entry).expanduser()
+        for entry in os.environ.get(KERNEL_PATH_ENV, '').split(os.pathsep)
+        if entry.strip()
+    ]
+    user_cache = user_kernel_cache_location()
+    if user_cache is not None:
+        locations.append(user_cache)
+    locations.append(PREBUILT_KERNELS_LOCATION)
+    return tuple(dict.fromkeys(locations))
+
+
+def _lookup_locations(search_path):
+    """
+    Return the directories that a lookup with `search_path` searches (see
+    `get_suitable_kernel`).
+    """
+    if search_path or (search_path is None
+                       and os.access(PREBUILT_KERNELS_LOCATION, os.W_OK)):
+        return kernel_search_path()
+    return (PREBUILT_KERNELS_LOCATION,)
+
+
+def _link_into_prebuilt_location(match):
+    """
+    Make the kernel of `match` loadable from `PREBUILT_KERNELS_LOCATION`,
+    where Xtrack loads kernels from, by linking its binary there if it is in
+    another directory of the search path. Return the match in
+    `PREBUILT_KERNELS_LOCATION`, or None if the binary cannot be linked, e.g.
+    because a kernel of the same name is bundled there.
+    """
+    module_name, tracker_element_classes, containing_dir, built_in_values = match
+    if Path(containing_dir) == PREBUILT_KERNELS_LOCATION:
+        return match
+
+    binary_file = _kernel_binary_file(module_name, containing_dir).absolute()
+    link = _kernel_binary_file(module_name, PREBUILT_KERNELS_LOCATION)
+    try:
+        if link.is_symlink() and link.readlink() != binary_file:
+            link.unlink()  # Left by a kernel that is gone or moved
+        if not link.is_symlink():
+            link.symlink_to(binary_file)
+            save_kernel_index(PREBUILT_KERNELS_LOCATION)
+    except FileExistsError:
+        # Linked by another process meanwhile, or a bundled kernel
+        if not link.is_symlink() or os.readlink(link) != str(binary_file):
+            return None
+    except OSError:
+        return None
+    return module_name, tracker_element_classes, PREBUILT_KERNELS_LOCATION, built_in_values
+
+
+def user_kernel_cache_location() -> Optional[Path]:
+    """
+    Return the per-user kernel cache directory, or None if it is disabled.
+    It is `XSUITE_KERNEL_CACHE` if set, otherwise `xsuite/kernels` in the
+    XDG cache directory (`~/.cache` by default).
+    """
+    location = os.environ.get(USER_KERNEL_CACHE_ENV)
+    if location is not None:
+        location = location.strip()
+        return Path(location).expanduser() if location else None
+
+    cache_home = os.environ.get('XDG_CACHE_HOME', '').strip() or '~/.cache'
+    return Path(cache_home).expanduser() / 'xsuite' / 'kernels'
+
+
+def _compile_into_user_cache(config, tracker_element_classes, classes, context_key):
+    """
+    Compile the kernel requested from `get_suitable_kernel` into the user
+    kernel cache, unless it is there already (e.g. compiled by another
+    process), and return it like `get_suitable_kernel` does. Return None,
+    leaving the compilation to the caller, when the cache is disabled or not
+    writable, when the classes are not part of the kernel definitions, or when
+    the compilation fails.
+
+    The kernel is built in a private subdirectory and moved into the cache,
+    its metadata last, so that concurrent processes only see complete kernels.
+    """
+    from cffi import VerificationError
+    from setuptools.errors import CCompilerError
+
+    from xsuite.kernel_definitions import NAME_CLASS_MAP
+
+    location = user_kernel_cache_location()
+    if location is None:
+        return None
+
+    element_classes = [cls._DressingClass for cls in tracker_element_classes]
+    extra_classes = [getattr(cls, '_DressingClass', cls) for cls in classes]
+    if any(NAME_CLASS_MAP.get(cls.__name__) is not cls for cls in element_classes):
+        return None
+
+    config = dict(config)
+    base_module_name = _custom_kernel_name(
+        [cls.__name__ for cls in (*element_classes, *extra_classes)], config)
+    module_name = _kernel_module_name(base_module_name, context_key)
+    definition = {
+        'config': config,
+        'classes': element_classes,
+        'extra_classes': extra_classes,
+    }
+
+    kernel_metadata = _cached_custom_kernel(location, module_name)
+    if kernel_metadata is None:
+        try:
+            location.mkdir(parents=True, exist_ok=True)
+            build_dir = Path(tempfile.mkdtemp(prefix='.build_', dir=location))
+        except OSError:
+            return None
+
+        try:
+            build_single_kernel(
+                0, 1, build_dir, definition, module_name, base_module_name,
+                context_key, jobs_per_kernel=_available_cpus(), custom=True,
+            )
+            binary_file = _kernel_binary_file(module_name, build_dir)
+            os.replace(binary_file, location / binary_file.name)
+            metadata_file = build_dir / f'{module_name}.json'
+            os.replace(metadata_file, location / metadata_file.name)
+            save_kernel_index(location)
+        except (OSError, CCompilerError, VerificationError) as err:
+            _print(f'The kernel `{module_name}` could not be compiled into the '
+                   f'user kernel cache `{location}`: {err}')
+            return None
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+        _SUITABLE_KERNEL_MEMO.clear()
+        kernel_metadata = _existing_metadata(location / f'{module_name}.json')
+    tracker_class_names = kernel_metadata['tracker_element_classes']
+    return {
+        'module_name': module_name,
+        'tracker_element_classes': [NAME_CLASS_MAP[name] for name in tracker_class_names],
+        'containing_dir': location,
+    }
+
+
+def _cached_custom_kernel(location, module_name):
+    """
+    Return the metadata of the kernel `module_name` of the user kernel cache
+    `location`, or None if it is not there or built for other package
+    versions. The metadata is moved into the cache last, so a kernel with
+    metadata is complete.
+    """
+    kernel_metadata = _existing_metadata(Path(location) / f'{module_name}.json')
+    if not kernel_metadata or not _kernel_binary_file(module_name, location).exists():
+        return None
+    if kernel_metadata.get('versions') != _current_package_versions():
+        return None
+    return kernel_metadata
+
+
+def _class_name_mask(class_names):
+    """Return the bitmask of a collection of class names, see `_CLASS_NAME_BITS`."""
+    mask = 0
+    for name in class_names:
+        bit = _CLASS_NAME_BITS.get(name)
+        if bit is None:
+            with _CLASS_NAME_BITS_LOCK:
+                bit = _CLASS_NAME_BITS.setdefault(name, 1 << len(_CLASS_NAME_BITS))
+        mask |= bit
+    return mask
+
+
+def _class_names_from_mask(mask):
+    """Return the list of class names whose bits are set in `mask`."""
+    return [name for name, bit in list(_CLASS_NAME_BITS.items()) if mask & bit]
+
+
+def _freeze_config(config, runtime_keys=()):
+    """
+    Return a hashable equivalent of a tracker config (see `_normalize_config`),
+    or None if one of its values cannot be hashed.
+    """
+    try:
+        return frozenset(_normalize_config(config, runtime_keys).items())
+    except TypeError:
+        return None
+
+
+def _normalize_config(config, runtime_keys=()):
+    """
+    Return a tracker config without its False flags, which generate the same
+    code as absent keys, and with the numeric values of `runtime_keys`
+    replaced by `_RUNTIME_VALUE`.
+    """
+    from xsuite.runtime_config import _is_numeric
+
+    normalized = {}
+    for key, value in dict(config).items():
+        if value is False:
+            continue
+        if key in runtime_keys and _is_numeric(value):
+            value = _RUNTIME_VALUE
+        normalized[key] = value
+    return normalized
+
+
+def _runtime_values(config, runtime_keys):
+    """Return the values of `runtime_keys` in `config`, as passed to the kernel."""
+    return {key: float(config[key]) for key in runtime_keys}
+
+
+def _bind_runtime_config(match, config):
+    """
+    Pass the values of the config keys that the kernel of `match` takes at run
+    time (see `xsuite.runtime_config`). Return False if the kernel is already
+    in use with other values in this process.
+    """
+    from xsuite import instrumentation, runtime_config
+
+    module_name, _, containing_dir, built_in_values = match
+    if not built_in_values:
+        return True
+    with instrumentation.timed('load', module_name=module_name):
+        return runtime_config.bind(
+            module_name,
+            _kernel_binary_file(module_name, containing_dir),
+            _runtime_values(config, built_in_values),
+            built_in_values,
+        )
+
+
 def _context_keys_from_cli(context) -> Optional[Tuple[str, ...]]:
     """
     Convert the ``xsuite-prebuild`` context option to context keys.
@@ -499,6 +2091,74 @@ def _context_keys_from_cli(context) -> Optional[Tuple[str, ...]]:
     return tuple(context_keys)
 
 
+def _kernel_module_name(base_module_name, context_key, isa=None, pgo=False, flavor=None):
+    """Return the module name of a kernel, e.g. ``default_cpu_serial_x86_64_v3_pgo``."""
+    module_name = f'{base_module_name}{CONTEXT_SUFFIXES[context_key]}'
+    if isa is not None:
+        module_name += _isa_suffix(isa)
+    if flavor is not None:
+        module_name += f'_{flavor}'
+    if pgo:
+        module_name += PGO_SUFFIX
+    return module_name
+
+
+def _isa_suffix(isa):
+    return '_' + isa.replace('-', '_')
+
+
+def _isa_level(isa):
+    """Rank instruction set variants, 0 being the baseline."""
+    return 0 if isa is None else list(ISA_VARIANTS).index(isa) + 1
+
+
+@lru_cache(maxsize=None)
+def _cpu_features():
+    """Return the feature flags of the running CPU, as listed in /proc/cpuinfo."""
+    try:
+        with open('/proc/cpuinfo', 'r') as fd:
+            for line in fd:
+                if line.startswith('flags'):
+                    return frozenset(line.split(':', 1)[1].split())
+    except OSError:  # Not Linux
+        pass
+    return frozenset()
+
+
+def _cpu_supports_isa(isa):
+    return ISA_VARIANTS[isa].cpu_features <= _cpu_features()
+
+
+@lru_cache(maxsize=None)
+def _compiler_supports_isa(isa):
+    """Whether the compiler used by CFFI can target the variant `isa`."""
+    if isa not in ISA_VARIANTS:
+        raise ValueError(f'Unknown instruction set variant `{isa}`; expected '
+                         f'one of {", ".join(ISA_VARIANTS)}.')
+    if platform.machine().lower() not in ('x86_64', 'amd64'):
+        return False
+
+    compiler = (os.environ.get('CC') or sysconfig.get_config_var('CC') or 'cc').split()
+    try:
+        subprocess.run(
+            [*compiler, *ISA_VARIANTS[isa].compiler_flags, '-x', 'c', '-E', os.devnull],
+            capture_output=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+def _requested_kernel_flavor(flavor=None):
+    """Return the requested kernel flavor, by default from `KERNEL_FLAVOR_ENV`."""
+    if flavor is None:
+        flavor = os.environ.get(KERNEL_FLAVOR_ENV, '').strip() or None
+    if flavor is not None and flavor not in KERNEL_FLAVORS:
+        raise ValueError(f'Unknown kernel flavor `{flavor}`; expected one of '
+                         f'{", ".join(KERNEL_FLAVORS)}.')
+    return flavor
+
+
 def _split_module_name(module_name: str) -> Tuple[str, str]:
     """
     Split a context-suffixed module name into base module name and context.
@@ -506,21 +2166,123 @@ def _split_module_name(module_name: str) -> Tuple[str, str]:
     For example, ``"default_cpu_openmp"`` returns
     ``("default", "openmp")``. Names without a known suffix are treated as
     legacy serial kernels, so ``"default"`` returns ``("default", "serial")``.
+    Instruction set variant, flavor and profile-guided suffixes are dropped,
+    so ``"default_cpu_serial_x86_64_v3_pgo"`` returns ``("default", "serial")``.
     """
+    module_name = module_name.removesuffix(PGO_SUFFIX)
+    for flavor in KERNEL_FLAVORS:
+        module_name = module_name.removesuffix(f'_{flavor}')
+    for isa in ISA_VARIANTS:
+        if module_name.endswith(_isa_suffix(isa)):
+            module_name = module_name[:-len(_isa_suffix(isa))]
+            break
+
     for context_key, suffix in CONTEXT_SUFFIXES.items():
         if module_name.endswith(suffix):
             return module_name[:-len(suffix)], context_key
     return module_name, SERIAL_CONTEXT
 
 
-def _iter_kernel_metadata_files():
+def _iter_kernel_metadata_files(location=None):
     """Yield user-visible kernel metadata files from the prebuilt-kernel cache."""
-    for metadata_file in sorted(PREBUILT_KERNELS_LOCATION.glob('*.json')):
+    if location is None:
+        location = PREBUILT_KERNELS_LOCATION
+    for metadata_file in sorted(Path(location).glob('*.json')):
         if metadata_file.name.startswith('_'):
             continue
         yield metadata_file
 
 
+def _list_kernel_directory(location):
+    """Return the set of file names in a kernel directory (empty if missing)."""
+    try:
+        return set(os.listdir(location))
+    except OSError:
+        return set()
+
+
+def _load_kernel_metadata(location, file_names):
+    """
+    Return ``(metadata file name, entry)`` pairs for every kernel in
+    `location`, where `entry` is the result of `_read_kernel_metadata`, or the
+    exception raised when reading the file.
+
+    The consolidated index is used when it is up to date with `file_names`,
+    the listing of `location`; otherwise every metadata file is parsed.
+    """
+    metadata_file_names = sorted(
+        name for name in file_names
+        if name.endswith('.json') and not name.startswith('_')
+    )
+
+    index_entries = _read_kernel_index(location, metadata_file_names)
+    if index_entries is not None:
+        return index_entries
+
+    entries = []
+    for metadata_file_name in metadata_file_names:
+        try:
+            entry = _read_kernel_metadata(Path(location) / metadata_file_name)
+        except Exception as err:
+            entry = err
+        entries.append((metadata_file_name, entry))
+    return entries
+
+
+def _read_kernel_index(location, metadata_file_names):
+    """
+    Load the entries of the consolidated index written by `save_kernel_index`.
+
+    Return None when the index is missing, unreadable, of a different layout
+    version, or stale, i.e. when the directory was modified after the index
+    was written, or when the index does not describe exactly the metadata
+    files in `metadata_file_names`.
+    """
+    index_file = Path(location) / KERNEL_INDEX_FILE_NAME
+    try:
+        if os.stat(index_file).st_mtime_ns != os.stat(location).st_mtime_ns:
+            return None
+        with index_file.open('r') as fd:
+            index = json.load(fd)
+        if index['index_version'] != KERNEL_INDEX_VERSION:
+            return None
+
+        entries = []
+        for kernel in index['kernels']:
+            if 'error' in kernel:
+                entry = ValueError(kernel['error'])
+            else:
+                entry = (
+                    kernel['module_name'],
+                    kernel['metadata'],
+                    kernel['explicit_context'],
+                )
+            entries.append((kernel['metadata_file'], entry))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if sorted(name for name, _ in entries) != metadata_file_names:
+        return None
+
+    return entries
+
+
+def _read_kernel_order(location):
+    """
+    Return the position of each base module name in `kernel_definitions`, and
+    their `BASE_CONFIG`, as recorded in the index of `location`, or an empty
+    dict and None if unknown.
+    """
+    try:
+        with (Path(location) / KERNEL_INDEX_FILE_NAME).open('r') as fd:
+            index = json.load(fd)
+        kernel_order = index.get('kernel_order', [])
+        base_config = index.get('base_config')
+        return {name: idx for idx, name in enumerate(kernel_order)}, base_config
+    except (OSError, ValueError, AttributeError, TypeError):
+        return {}, None
+
+
 def _kernel_binary_file(module_name, location=None):
     """
     Return the ABI-specific extension-module path for a kernel module.
@@ -562,6 +2324,12 @@ def _read_kernel_metadata(metadata_file):
     return module_name, kernel_metadata, explicit_context
 
 
+def _print(*args, **kwargs):
+    """Print like the rest of Xsuite, honouring `xobjects.settings.print_mode`."""
+    from xtrack.general import _print
+    _print(*args, **kwargs)
+
+
 def _format_list(items, limit=5):
     """Format a short bullet list, truncating after ``limit`` entries."""
     items = list(items)
@@ -577,6 +2345,8 @@ def _build_no_suitable_kernel_message(
         closest_rejection_reason,
 ):
     """Build the error text explaining why no cached kernel can be used."""
+    import xobjects as xo
+
     if diagnostics['metadata_file_count'] == 0:
         return (
             'Could not find a suitable Xsuite prebuilt kernel.\n'
@@ -0,0 +1,208 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Background loading of the prebuilt kernels that a process is likely to use.
+
+Loading a kernel maps a shared object of several megabytes and resolves its
+symbols, which the first tracker of a process otherwise waits for. Python keeps
+extension modules loaded for the lifetime of the process, and returns the same
+module when the same file is loaded again, so a kernel preloaded here is reused
+as is when Xtrack loads it from `PREBUILT_KERNELS_LOCATION`.
+
+Setting the environment variable `XSUITE_PRELOAD_KERNELS` starts the preload
+when `xsuite` is imported: either to `1` for the serial kernels, or to a list
+of contexts such as `serial,openmp`. For each context, the first tracking
+kernel with the default tracker config is preloaded together with the
+non-tracking kernels.
+
+Only the kernel metadata is read to choose the kernels, so that the preload
+does not import Xtrack and the other packages while the user's own code does.
+"""
+import importlib.util
+import os
+import threading
+
+from xsuite.prebuild_kernels import (
+    CUSTOM_KERNEL_PREFIX, KERNEL_FLAVORS, PREBUILT_KERNELS_LOCATION, SERIAL_CONTEXT,
+    _context_keys_from_cli, _cpu_supports_isa, _isa_level, _kernel_binary_file,
+    _list_kernel_directory, _load_kernel_metadata, _normalize_config,
+    _read_kernel_order, _requested_kernel_flavor, kernel_search_path,
+)
+
+PRELOAD_KERNELS_ENV = 'XSUITE_PRELOAD_KERNELS'
+
+# Added to the tracker element classes of every kernel by `build_single_kernel`,
+# the kernels with only these do not track
+_MONITOR_CLASS_NAMES = frozenset({'ParticlesMonitor', 'MultiElementMonitor'})
+
+_PRELOADED_MODULES = {}
+_PRELOAD_EVENTS = {}
+_PRELOAD_LOCK = threading.Lock()
+
+
+def preload_kernels(
+        contexts=(SERIAL_CONTEXT,),
+        kernels=None,
+        max_kernels=1,
+        search_path=False,
+        wait=False,
+) -> threading.Thread:
+    """
+    Load the most likely prebuilt kernels for `contexts` on a background
+    thread, and return the thread.
+
+    The kernels are taken in the order in which `get_suitable_kernel` tries
+    them, keeping the best instruction set variant of each one, up to
+    `max_kernels` tracking kernels per context (all of them if None), in
+    addition to the kernel without tracker elements (`non_tracking_kernels`),
+    which serves the other kernels of Xtrack. The tracking kernels built with
+    the default tracker config (`BASE_CONFIG`) come first. `kernels`
+    restricts the choice to the given base module names. With `search_path`,
+    the kernels of the whole `kernel_search_path` are considered, for callers
+    loading kernels from there. With `wait`, return after the kernels are loaded.
+    """
+    if kernels is not None and isinstance(kernels, str):
+        kernels = [kernels]
+
+    to_load = _likely_kernels(
+        context_keys=_context_keys_from_cli(contexts),
+        kernels=kernels,
+        max_kernels=max_kernels,
+        search_path=search_path,
+    )
+    with _PRELOAD_LOCK:
+        to_load = [(module_name, binary_file) for module_name, binary_file in to_load
+                   if module_name not in _PRELOAD_EVENTS]
+        for module_name, _ in to_load:
+            _PRELOAD_EVENTS[module_name] = threading.Event()
+
+    thread = threading.Thread(
+        target=_preload, args=(to_load,), name='xsuite-preload-kernels', daemon=True)
+    thread.start()
+    if wait:
+        thread.join()
+    return thread
+
+
+def preloaded_kernels():
+    """Return the names of the kernel modules preloaded so far."""
+    with _PRELOAD_LOCK:
+        return list(_PRELOADED_MODULES)
+
+
+def wait_for_kernel(module_name, timeout=None):
+    """If `module_name` is being preloaded, wait until it is loaded."""
+    event = _PRELOAD_EVENTS.get(module_name)
+    if event is not None:
+        event.wait(timeout)
+
+
+def _preload(to_load):
+    from xsuite import instrumentation
+
+    for module_name, binary_file in to_load:
+        try:
+            with instrumentation.timed('preload', module_name=module_name):
+                spec = importlib.util.spec_from_file_location(module_name, binary_file)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+        except Exception as err:  # Xtrack will report the error if it loads it
+            instrumentation.trace('preload_error', module_name=module_name,
+                                  error=str(err))
+        else:
+            with _PRELOAD_LOCK:
+                _PRELOADED_MODULES[module_name] = module
+        finally:
+            _PRELOAD_EVENTS[module_name].set()
+
+
+def _likely_kernels(context_keys, kernels, max_kernels, search_path):
+    """
+    Return the (module name, binary file) of the kernels to preload, using
+    the same order and the same CPU and flavor checks as
+    `_scan_kernel_candidates`, but without checking the package versions,
+    which would import the whole Xsuite stack.
+    """
+    requested_flavor = _requested_kernel_flavor()
+    locations = kernel_search_path() if search_path else (PREBUILT_KERNELS_LOCATION,)
+
+    ranked = []
+    seen_module_names = set()
+    for location in locations:
+        kernel_order, base_config = _read_kernel_order(location)
+        if base_config is not None:
+            base_config = _normalize_config(base_config)
+        file_names = _list_kernel_directory(location)
+        for _, entry in _load_kernel_metadata(location, file_names):
+            if isinstance(entry, Exception):
+                continue
+            module_name, metadata, _ = entry
+            if module_name in seen_module_names:
+                continue
+            seen_module_names.add(module_name)
+
+            base_module_name = metadata['base_module_name']
+            custom = metadata.get('custom', False)
+            if kernels is not None and base_module_name not in kernels:
+                continue
+            if metadata['context'] not in context_keys:
+                continue
+            binary_file = _kernel_binary_file(module_name, location)
+            if binary_file.name not in file_names:
+                continue
+            isa = metadata.get('isa')
+            if isa is not None and not _cpu_supports_isa(isa):
+                continue
+            flavor = metadata.get('flavor')
+            if flavor is not None and (flavor not in KERNEL_FLAVORS
+                                       or flavor != requested_flavor):
+                continue
+
+            tracking = not set(metadata['tracker_element_classes']) <= _MONITOR_CLASS_NAMES
+            if custom or base_module_name.startswith(CUSTOM_KERNEL_PREFIX):
+                priority = (0, len(metadata['tracker_element_classes']))
+            else:
+                # Kernels with the default tracker config first, the most used
+                priority = (
+                    1,
+                    0 if (_normalize_config(metadata['config']) == base_config
+                          and 'runtime_config' not in metadata) else 1,
+                    kernel_order.get(base_module_name, len(kernel_order)),
+                )
+            rank = (
+                priority,
+                0 if flavor is not None else 1,
+                -_isa_level(isa),
+                0 if 'pgo' in metadata else 1,
+                module_name,
+            )
+            ranked.append((rank, metadata['context'], tracking, base_module_name,
+                           module_name, binary_file))
+
+    to_load = []
+    loaded_per_kind = {}
+    seen_kernels = set()
+    for _, context_key, tracking, base_module_name, module_name, binary_file in sorted(
+            ranked):
+        if (context_key, base_module_name) in seen_kernels:
+            continue  # A better variant of the same kernel is loaded already
+        kind = (context_key, tracking)
+        limit = max_kernels if tracking or max_kernels is None else 1
+        if limit is not None and loaded_per_kind.get(kind, 0) >= limit:
+            continue
+        seen_kernels.add((context_key, base_module_name))
+        loaded_per_kind[kind] = loaded_per_kind.get(kind, 0) + 1
+        to_load.append((module_name, binary_file))
+    return to_load
+
+
+def _preload_from_environment():
+    """Start preloading kernels if `XSUITE_PRELOAD_KERNELS` asks for it."""
+    value = os.environ.get(PRELOAD_KERNELS_ENV, '').strip().lower()
+    if value in ('', '0', 'false', 'no'):
+        return
+    if value in ('1', 'true', 'yes'):
+        value = SERIAL_CONTEXT
+    preload_kernels(contexts=value)
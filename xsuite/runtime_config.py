@@ -0,0 +1,134 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Tracker config values that prebuilt kernels take at run time.
+
+Xtrack turns the tracker config into preprocessor definitions, so every value
+is compiled into the kernel. Most keys are feature toggles, which select the
+code that is generated (e.g. `XTRACK_MULTIPOLE_NO_SYNRAD`). The keys of
+`RUNTIME_CONFIG_KEYS` are plain numeric parameters instead: in the kernels
+of the definitions with `runtime_config` (see `xsuite.kernel_definitions`),
+they are redefined to read a variable of the kernel module, initialized to
+the value of the definition and set through the kernel `xsuite_set_<key>` of
+`KernelRuntimeConfig` when the kernel is selected with another one. Such a
+kernel therefore serves any value of these keys, but only requires them to be
+present or absent, like the toggles. The other kernels keep the values
+compiled in, and are preferred when they match the request exactly.
+
+The variables belong to the loaded kernel module, which is shared by all the
+trackers of a process. A kernel is therefore bound to the first values it is
+selected with, and is not selected with different values afterwards.
+
+The `OPTIONAL_FEATURE_FLAGS` only leave out code that the elements otherwise
+run depending on their own flags, e.g. `radiation_flag`, which Xtrack sets
+together with the config. A kernel built without them tracks the same as
+long as these element flags are off, only more slowly, and can stand in for
+the requested kernel while it is compiled (see `xsuite.background_build`).
+"""
+import importlib.util
+import threading
+
+# Numeric config keys, with the C type of their value
+RUNTIME_CONFIG_KEYS = {
+    'XTRACK_GLOBAL_XY_LIMIT': 'double',
+}
+
+# Flags removing the code of features that the elements enable at run time
+OPTIONAL_FEATURE_FLAGS = (
+    'XTRACK_MULTIPOLE_NO_SYNRAD',
+    'XFIELDS_BB3D_NO_BEAMSTR',
+    'XFIELDS_BB3D_NO_BHABHA',
+)
+
+_BOUND_VALUES = {}
+_BOUND_VALUES_LOCK = threading.Lock()
+
+
+def runtime_config_keys(config):
+    """Return the keys of `config` that a prebuilt kernel can take at run time."""
+    return sorted(
+        key for key, value in dict(config).items()
+        if key in RUNTIME_CONFIG_KEYS and _is_numeric(value)
+    )
+
+
+def runtime_config_headers(config):
+    """
+    Return the C headers that make a kernel read the keys of
+    `runtime_config_keys(config)` from variables initialized to their values
+    in `config`. They come after the definitions of the config itself.
+    """
+    headers = []
+    for key, c_type in RUNTIME_CONFIG_KEYS.items():
+        initial_value = config.get(key) if key in runtime_config_keys(config) else 0
+        headers.append(f'static {c_type} xsuite_runtime_{key} = {initial_value};')
+    for key in runtime_config_keys(config):
+        headers.append(f'#undef {key}')
+        headers.append(f'#define {key} (xsuite_runtime_{key})')
+    return headers
+
+
+def kernel_runtime_config_class():
+    """
+    Return the class whose kernels set the variables of
+    `runtime_config_headers`; it is added to the extra classes of the kernels.
+    """
+    global KernelRuntimeConfig
+
+    if 'KernelRuntimeConfig' in globals():
+        return KernelRuntimeConfig
+
+    import xobjects as xo
+
+    class KernelRuntimeConfig(xo.Struct):
+        _extra_c_sources = [
+            f'void xsuite_set_{key}({c_type} value) {{ xsuite_runtime_{key} = value; }}'
+            for key, c_type in RUNTIME_CONFIG_KEYS.items()
+        ]
+        _kernels = {
+            f'xsuite_set_{key}': xo.Kernel(
+                c_name=f'xsuite_set_{key}',
+                args=[xo.Arg(xo.Float64, name='value')],
+            )
+            for key in RUNTIME_CONFIG_KEYS
+        }
+
+    return KernelRuntimeConfig
+
+
+def can_bind(binary_file, values):
+    """
+    Tell whether the kernel `binary_file` can take the runtime config
+    `values`: it is not bound yet in this process, or bound to the same ones.
+    """
+    bound = _BOUND_VALUES.get(str(binary_file))
+    return bound is None or bound == values
+
+
+def bind(module_name, binary_file, values, built_in_values):
+    """
+    Set the runtime config `values` in the kernel module `module_name`
+    loaded from `binary_file`, unless they are its `built_in_values`. Python
+    keeps one module per file, which is the one Xtrack gets when it loads the
+    kernel. Return False if the kernel is already bound to other values.
+    """
+    key = str(binary_file)
+    with _BOUND_VALUES_LOCK:
+        bound = _BOUND_VALUES.get(key)
+        if bound is not None:
+            return bound == values
+
+        if values != built_in_values:
+            spec = importlib.util.spec_from_file_location(module_name, binary_file)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            for config_key, value in values.items():
+                getattr(module.lib, f'xsuite_set_{config_key}')(value)
+        _BOUND_VALUES[key] = dict(values)
+        return True
+
+
+def _is_numeric(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
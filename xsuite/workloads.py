@@ -0,0 +1,246 @@
+# copyright ############################### #
+# This file is part of the Xsuite project.  #
+# Copyright (c) CERN, 2025.                 #
+# ######################################### #
+"""
+Synthetic tracking workloads used to exercise prebuilt kernels.
+
+The training run of profile-guided builds (see
+`xsuite.prebuild_kernels.regenerate_kernels`) tracks `ring_particles` through
+`ring_line` with the kernel being built, in a separate interpreter:
+
+    python -m xsuite.workloads '<JSON training spec>'
+
+`BENCHMARK_LINES` are the standard lines of `xsuite-prebuild bench`.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+# Bump when the training workload changes, so that profile-guided kernels
+# built from an older profile are rebuilt by incremental regeneration.
+TRAINING_WORKLOAD_VERSION = 1
+TRAINING_N_PARTICLES = 1000
+TRAINING_N_TURNS = 20
+
+
+def ring_line(n_cells=50, p0c=7e12):
+    """
+    Return a ring of FODO cells with thick bends, quadrupoles and sextupoles,
+    thin corrector multipoles, apertures in every cell and one RF cavity.
+    """
+    import numpy as np
+    import xtrack as xt
+
+    cell_length = 20.
+    bend_length = 3.
+    bend_angle = 2 * np.pi / (2 * n_cells)
+
+    elements, names = [], []
+
+    def add(name, element):
+        elements.append(element)
+        names.append(name)
+
+    for cell in range(n_cells):
+        add(f'qf.{cell}', xt.Quadrupole(length=1., k1=0.1))
+        add(f'sf.{cell}', xt.Sextupole(length=0.3, k2=0.05))
+        add(f'mcf.{cell}', xt.Multipole(knl=[1e-7], ksl=[-1e-7]))
+        add(f'apf.{cell}', xt.LimitEllipse(a=0.02, b=0.02))
+        add(f'd1.{cell}', xt.Drift(length=1.2))
+        add(f'mb1.{cell}', xt.Bend(length=bend_length, angle=bend_angle,
+                                   k0_from_h=True))
+        add(f'd2.{cell}', xt.Drift(length=4.5))
+        add(f'qd.{cell}', xt.Quadrupole(length=1., k1=-0.1))
+        add(f'sd.{cell}', xt.Sextupole(length=0.3, k2=-0.05))
+        add(f'apd.{cell}', xt.LimitRect(min_x=-0.02, max_x=0.02,
+                                        min_y=-0.015, max_y=0.015))
+        add(f'd3.{cell}', xt.Drift(length=1.2))
+        add(f'mb2.{cell}', xt.Bend(length=bend_length, angle=bend_angle,
+                                   k0_from_h=True))
+        add(f'd4.{cell}', xt.Drift(length=cell_length - 2 * 1.3 - 2 * 1.2
+                                   - 2 * bend_length - 4.5))
+
+    circumference = n_cells * cell_length
+    add('cavity', xt.Cavity(voltage=6e6, frequency=400 * 299792458. / circumference,
+                            phase=np.pi))
+
+    line = xt.Line(elements=elements, element_names=names)
+    line.particle_ref = xt.Particles(p0c=p0c, mass0=xt.PROTON_MASS_EV)
+    return line
+
+
+def thin_ring_line(n_cells=50, p0c=7e12, radiation=False):
+    """
+    Return a ring of thin FODO cells: dipole, quadrupole and sextupole kicks
+    between drifts, apertures in every cell and one RF cavity. With
+    `radiation`, the dipole kicks radiate (mean energy loss) and the beam is
+    made of electrons, which needs a kernel built with synchrotron radiation.
+    """
+    import numpy as np
+    import xtrack as xt
+
+    cell_length = 20.
+    bend_angle = 2 * np.pi / (2 * n_cells)
+    radiation_flag = 1 if radiation else 0
+
+    elements, names = [], []
+
+    def add(name, element):
+        elements.append(element)
+        names.append(name)
+
+    for cell in range(n_cells):
+        add(f'qf.{cell}', xt.Multipole(knl=[0., 0.1]))
+        add(f'sf.{cell}', xt.Multipole(knl=[0., 0., 0.015]))
+        add(f'apf.{cell}', xt.LimitEllipse(a=0.02, b=0.02))
+        add(f'd1.{cell}', xt.Drift(length=2.5))
+        add(f'mb1.{cell}', xt.Multipole(knl=[bend_angle], hxl=bend_angle,
+                                        length=3., radiation_flag=radiation_flag))
+        add(f'd2.{cell}', xt.Drift(length=5.))
+        add(f'qd.{cell}', xt.Multipole(knl=[0., -0.1]))
+        add(f'sd.{cell}', xt.Multipole(knl=[0., 0., -0.015]))
+        add(f'apd.{cell}', xt.LimitRect(min_x=-0.02, max_x=0.02,
+                                        min_y=-0.015, max_y=0.015))
+        add(f'd3.{cell}', xt.Drift(length=2.5))
+        add(f'mb2.{cell}', xt.Multipole(knl=[bend_angle], hxl=bend_angle,
+                                        length=3., radiation_flag=radiation_flag))
+        add(f'd4.{cell}', xt.Drift(length=cell_length - 10.))
+
+    circumference = n_cells * cell_length
+    # A low energy electron beam needs a much weaker RF kick
+    voltage = 1e5 if radiation else 6e6
+    add('cavity', xt.Cavity(voltage=voltage, frequency=400 * 299792458. / circumference,
+                            phase=np.pi))
+
+    line = xt.Line(elements=elements, element_names=names)
+    if radiation:
+        line.particle_ref = xt.Particles(p0c=1e9, mass0=xt.ELECTRON_MASS_EV)
+    else:
+        line.particle_ref = xt.Particles(p0c=p0c, mass0=xt.PROTON_MASS_EV)
+    return line
+
+
+def collimated_ring_line(n_cells=50, p0c=7e12):
+    """Return `ring_line` with a black absorber collimator in every fifth cell."""
+    import xcoll as xc
+    import xtrack as xt
+
+    ring = ring_line(n_cells=n_cells, p0c=p0c)
+    elements, names = [], []
+    for name in ring.element_names:
+        elements.append(ring.element_dict[name])
+        names.append(name)
+        if name.startswith('apf.') and int(name.split('.')[1]) % 5 == 0:
+            elements.append(xc.BlackAbsorber(length=0., jaw=0.008))
+            names.append(f'tcp.{name.split(".")[1]}')
+
+    line = xt.Line(elements=elements, element_names=names)
+    line.particle_ref = ring.particle_ref
+    return line
+
+
+# The lines of `xsuite-prebuild bench`: a builder taking the number of cells,
+# and the config values that a kernel needs for the line (False meaning unset).
+BENCHMARK_LINES = {
+    'thin': (thin_ring_line, {}),
+    'thick': (lambda n_cells: ring_line(n_cells=n_cells), {}),
+    'collimation': (collimated_ring_line, {}),
+    'radiation': (lambda n_cells: thin_ring_line(n_cells=n_cells, radiation=True),
+                  {'XTRACK_MULTIPOLE_NO_SYNRAD': False}),
+}
+
+
+def ring_particles(line, n_particles, seed=0, _context=None):
+    """Return a Gaussian bunch for `ring_line`, a small fraction of it being lost."""
+    import numpy as np
+    import xtrack as xt
+
+    rng = np.random.default_rng(seed)
+    return xt.Particles(
+        _context=_context,
+        p0c=line.particle_ref.p0c[0],
+        mass0=line.particle_ref.mass0,
+        x=rng.normal(scale=3e-3, size=n_particles),
+        px=rng.normal(scale=1e-4, size=n_particles),
+        y=rng.normal(scale=3e-3, size=n_particles),
+        py=rng.normal(scale=1e-4, size=n_particles),
+        zeta=rng.normal(scale=0.05, size=n_particles),
+        delta=rng.normal(scale=1e-4, size=n_particles),
+    )
+
+
+def attach_kernel(line, module_name, location, config, tracker_element_class_names):
+    """
+    Make the tracker of `line` use the compiled kernel `module_name` from the
+    directory `location`, whatever kernel the usual lookup would choose. The
+    kernel must have been built with `config` and provide the classes named
+    `tracker_element_class_names`, as recorded in its metadata.
+    """
+    import xtrack as xt
+
+    from xsuite import instrumentation
+    from xsuite.kernel_definitions import NAME_CLASS_MAP
+    from xsuite.prebuild_kernels import (
+        _bind_runtime_config, _existing_metadata, _runtime_values)
+
+    tracker = line.tracker
+    tracker.config.clear()
+    tracker.config.update(config)
+
+    kernel_element_classes = [NAME_CLASS_MAP[name] for name in tracker_element_class_names]
+    kernel_description = xt.Tracker.get_kernel_descriptions(
+        kernel_element_classes=kernel_element_classes)['track_line']
+    with instrumentation.timed('load', module_name=module_name):
+        kernels = tracker._context.kernels_from_file(
+            module_name=module_name,
+            containing_dir=Path(location),
+            kernel_descriptions={'track_line': kernel_description},
+        )
+
+    # Keep a kernel taking config values at run time at the values of `config`
+    metadata_file = Path(location) / f'{module_name}.json'
+    kernel_metadata = _existing_metadata(metadata_file)
+    built_in_values = _runtime_values(
+        kernel_metadata.get('config', {}), kernel_metadata.get('runtime_config', ()))
+    _bind_runtime_config((module_name, (), Path(location), built_in_values), config)
+
+    hash_config = tracker._hashable_config()
+    tracker.track_kernel[hash_config] = kernels['track_line']
+    tracker._tracker_data_cache.pop(hash_config, None)
+
+
+def train_kernel(spec):
+    """
+    Run the training workload of a profile-guided build. `spec` holds the
+    `module_name`, `location`, `context`, `config` and
+    `tracker_element_classes` of the instrumented kernel.
+    """
+    import xobjects as xo
+
+    from xsuite.prebuild_kernels import SERIAL_CONTEXT
+
+    if spec['context'] == SERIAL_CONTEXT:
+        context = xo.ContextCpu()
+    else:
+        context = xo.ContextCpu(omp_num_threads='auto')
+
+    line = ring_line()
+    line.build_tracker(_context=context, compile=False)
+    attach_kernel(line, spec['module_name'], spec['location'], spec['config'],
+                  spec['tracker_element_classes'])
+
+    particles = ring_particles(line, TRAINING_N_PARTICLES, _context=context)
+    start_time = time.perf_counter()
+    line.track(particles, num_turns=TRAINING_N_TURNS)
+    return {
+        'workload_version': TRAINING_WORKLOAD_VERSION,
+        'n_particles': TRAINING_N_PARTICLES,
+        'n_turns': TRAINING_N_TURNS,
+        'duration_s': round(time.perf_counter() - start_time, 3),
+    }
+
+
+if __name__ == '__main__':
+    print(json.dumps(train_kernel(json.loads(sys.argv[1]))))